@@ -3,6 +3,7 @@ Violit - A Streamlit-like framework with reactive components
 Refactored with modular widget mixins
 """
 
+import functools
 import uuid
 import sys
 import threading
@@ -457,6 +458,8 @@ class App(
         
         # Styling System: configure_widget defaults + user CSS
         self._widget_defaults: Dict[str, Dict[str, Any]] = {}
+        # Bounded: per-call cls/style strings may be built dynamically
+        self._widget_style_cache = functools.lru_cache(maxsize=512)(self._merge_widget_cls_style)
         self._user_css: List[str] = []
         self._custom_widget_registry: Dict[str, Any] = {}
         self._custom_widget_exposed_methods: Dict[str, str] = {}
@@ -482,6 +485,9 @@ class App(
         
         self.ws_engine = WsEngine() if self.mode == 'ws' else None
         self.lite_engine = LiteEngine() if self.mode == 'lite' else None
+        # engine.click_attrs() per (cid, mode); keyed on the mode because
+        # app.run() may still switch it after widgets are declared
+        self._click_attrs_cache = functools.lru_cache(maxsize=4096)(self._build_click_attrs)
         self._lite_stream_queues: Dict[tuple[str, str], queue.Queue] = {}
         self._lite_stream_lock = threading.Lock()
         self._main_loop: asyncio.AbstractEventLoop | None = None
@@ -566,6 +572,15 @@ class App(
         """Get current engine (WS or Lite)"""
         return self.ws_engine if self.mode == 'ws' else self.lite_engine
 
+    def _build_click_attrs(self, cid: str, mode: str):
+        engine = self.ws_engine if mode == 'ws' else self.lite_engine
+        attrs = engine.click_attrs(cid)
+        return attrs, " ".join([f'{k}="{v}"' for k, v in attrs.items()])
+
+    def _click_attrs(self, cid: str):
+        """Return (attrs dict, serialized attrs) for a clickable cid in the current mode."""
+        return self._click_attrs_cache(cid, self.mode)
+
     @staticmethod
     def _normalize_root_path(root_path: Optional[str]) -> str:
         if not root_path:
@@ -651,6 +666,7 @@ class App(
             app.configure_widget("card", cls="rounded-2xl shadow-lg")
         """
         self._widget_defaults[widget_type] = {'cls': cls, 'style': style, 'part_cls': part_cls or {}}
+        self._widget_style_cache.cache_clear()
 
     def add_middleware(self, middleware_class, **options):
         """Register FastAPI or Starlette middleware on the underlying app.
@@ -928,22 +944,23 @@ class App(
             auto_widget_id_pass[occurrence_key] = occurrence + 1
             return f"{parent_ctx}_{prefix}_{anchor}_{occurrence}"
 
+        # Namespace the ID under the reactive block when inside one. This is
+        # the final ID for every path below except action-spawned widgets.
+        cid = f"{parent_ctx}_{prefix}_{count}" if is_reactive_parent else f"{prefix}_{count}"
+
         # Fast path for initial page render: the page is being built from scratch,
         # so phantom-widget prevention and action-specific ID rules are unnecessary.
         if initial_render_ctx.get(False) and not is_action:
-            cid = f"{parent_ctx}_{prefix}_{count}" if is_reactive_parent else f"{prefix}_{count}"
             store['component_count'] = count + 1
             return cid
-
-        temp_cid = f"{parent_ctx}_{prefix}_{count}" if is_reactive_parent else f"{prefix}_{count}"
         
         # In an action (e.g. on_click), if we are NOT in a render context,
         # we check for an existing component to prevent duplication.
         if is_action and parent_ctx is None:
             # We are in an action. If the component already exists, 
             # return its ID without incrementing count.
-            if temp_cid in store['builders'] or temp_cid in self.static_builders:
-                return temp_cid
+            if cid in store['builders'] or cid in self.static_builders:
+                return cid
             
             # [SIDELINE REDIRECTION]
             # When an action creates a widget (e.g. app.success() in an event handler),
@@ -952,17 +969,9 @@ class App(
             # that marks it as an "orphaned/action-spawned" widget.
             # This allows it to increment the counter locally for that action session
             # without colliding with the next render's static IDs.
-            cid = f"action_{prefix}_{count}"
             store['component_count'] = count + 1
-            return cid
+            return f"action_{prefix}_{count}"
 
-        # Check if we're inside a reactive block that needs namespacing
-        if is_reactive_parent:
-            # Namespace the ID under the reactive block
-            cid = f"{parent_ctx}_{prefix}_{count}"
-        else:
-            cid = f"{prefix}_{count}"
-        
         # Inside an active render scope we must keep advancing the per-view
         # counter even during action-triggered updates. Reusing the same count
         # within a dirty/full render pass can recreate identical auto IDs.
@@ -1010,6 +1019,7 @@ class App(
         store['builders'][cid] = builder
         if action:
             store['actions'][cid] = action
+            self._click_attrs(cid)
             
         curr_frag = fragment_ctx.get()
         l_ctx = layout_ctx.get()
@@ -4,12 +4,15 @@ import hmac
 import inspect
 import json
 import logging
+import os
 import queue
 import uuid
 from typing import List, Optional
+from urllib.parse import quote
 
 from fastapi import Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from starlette.websockets import WebSocketState
 
 from .app_assets import get_preconnect_links, get_vendor_resources
@@ -17,10 +20,68 @@ from .app_shell import build_html_response, build_shell_html, build_user_css
 from .app_template import HTML_TEMPLATE
 from .component import Component
 from .context import action_ctx, initial_render_ctx, pending_shared_views_ctx, session_ctx, view_ctx
-from .state import STATIC_STORE, clear_view_scoped_dependencies, get_session_store, touch_runtime_stores
+from .state import STATIC_STORE, clear_view_scoped_dependencies, discard_download_source, get_session_store, touch_runtime_stores
 
 
 VIEW_RESTORE_COOKIE = "_vl_reload_view"
+# Binary upload frames buffered per WebSocket before an action claims them
+WS_UPLOAD_BUFFER_LIMIT = 256 * 1024 * 1024
+
+
+def _attachment_disposition(file_name: str) -> str:
+    """Content-Disposition for a download, safe for any file name.
+
+    Starlette encodes headers as latin-1, so the plain ``filename`` is reduced to
+    printable ASCII and the real name goes in the RFC 5987 ``filename*`` form.
+    """
+    cleaned = file_name.replace("\r", "").replace("\n", "").replace('"', "")
+    ascii_name = "".join(ch if 32 <= ord(ch) < 127 and ch != "\\" else "_" for ch in cleaned) or "download"
+    return f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(cleaned, safe='')}"
+
+
+def _is_ws_upload_value(value) -> bool:
+    return isinstance(value, dict) and isinstance(value.get("_vl_upload"), dict)
+
+
+def _ws_upload_id(value):
+    """Upload id of a file_uploader '_vl_upload' action value (None if absent)."""
+    upload_id = value["_vl_upload"].get("id")
+    return upload_id if isinstance(upload_id, int) and not isinstance(upload_id, bool) else None
+
+
+def _claim_ws_upload(upload_buffer: bytearray, value):
+    """Replace a file_uploader '_vl_upload' action value with the streamed bytes.
+
+    The client sends each file as binary frames tagged with the upload id, in
+    order, and then the action carrying only their metadata. ``upload_buffer``
+    holds the frames received for that id; it is split by the declared sizes
+    and must match them exactly, otherwise ValueError is raised.
+    """
+    upload = value["_vl_upload"]
+
+    files = []
+    offset = 0
+    view = memoryview(upload_buffer)
+    try:
+        for meta in upload.get("files") or []:
+            size = int(meta.get("size") or 0)
+            if size < 0 or offset + size > len(upload_buffer):
+                raise ValueError("Upload incomplete")
+            files.append({
+                "name": meta.get("name"),
+                "type": meta.get("type"),
+                "size": size,
+                "data": bytes(view[offset:offset + size]),
+            })
+            offset += size
+        if offset != len(upload_buffer) or not files:
+            raise ValueError("Upload incomplete")
+    finally:
+        view.release()
+
+    if upload.get("multiple"):
+        return {"files": files}
+    return files[0]
 
 
 def _invoke_action_callback(action_callback, value):
@@ -535,8 +596,6 @@ class AppRuntimeMixin:
             current_view_id = self._resolve_http_view_id(request, sid, generate=False)
             session_token, view_token = self._set_runtime_context(sid, current_view_id)
             try:
-                import os
-
                 store = get_session_store()
                 registry = store.get("_vl_media_sources") or {}
                 payload = registry.get(media_id)
@@ -562,6 +621,48 @@ class AppRuntimeMixin:
             finally:
                 self._reset_runtime_context(session_token, view_token)
 
+        @self.fastapi.get("/__violit_download/{download_id}")
+        async def widget_download(request: Request, download_id: str):
+            sid = request.cookies.get("ss_sid")
+            if not sid:
+                return Response(status_code=404)
+
+            current_view_id = self._resolve_http_view_id(request, sid, generate=False)
+            session_token, view_token = self._set_runtime_context(sid, current_view_id)
+            try:
+                store = get_session_store()
+                registry = store.get("_vl_download_sources") or {}
+                payload = registry.get(download_id)
+                if not isinstance(payload, dict):
+                    return Response(status_code=404)
+                # download_file() entries are one-shot; their spooled file is
+                # removed once the response has been sent
+                background = None
+                if payload.get("once"):
+                    registry.pop(download_id, None)
+                    background = BackgroundTask(discard_download_source, payload)
+
+                media_type = str(payload.get("mime") or "application/octet-stream")
+                file_name = str(payload.get("name") or "download")
+                headers = {
+                    "Cache-Control": "private, no-store",
+                    "Content-Disposition": _attachment_disposition(file_name),
+                }
+                # Payloads built from file-like objects are spooled to disk
+                download_path = payload.get("path")
+                if download_path:
+                    if not os.path.isfile(download_path):
+                        return Response(status_code=404, background=background)
+                    return FileResponse(path=download_path, media_type=media_type, headers=headers,
+                                        background=background)
+                return Response(
+                    content=payload.get("data") or b"",
+                    media_type=media_type,
+                    headers=headers,
+                )
+            finally:
+                self._reset_runtime_context(session_token, view_token)
+
         @self.fastapi.get("/lite-stream")
         async def lite_stream(request: Request):
             sid = request.cookies.get("ss_sid")
@@ -719,6 +820,36 @@ class AppRuntimeMixin:
                 "viewAlive": is_view_alive
             })
 
+            # Binary upload frames start with a 4-byte upload id; only the upload
+            # currently being streamed is buffered. Its '_vl_upload' action claims
+            # the bytes, and other actions may arrive in between without touching
+            # them. An overflow is remembered so that upload is rejected, not truncated.
+            upload_id: Optional[int] = None
+            upload_buffer = bytearray()
+            upload_overflowed = False
+
+            def take_ws_upload(value):
+                nonlocal upload_id, upload_overflowed
+                declared_id = _ws_upload_id(value)
+                if declared_id is None or declared_id != upload_id:
+                    # No frames arrived for this upload (only valid when it is empty)
+                    return _claim_ws_upload(bytearray(), value)
+                try:
+                    if upload_overflowed:
+                        raise ValueError("Upload too large")
+                    return _claim_ws_upload(upload_buffer, value)
+                finally:
+                    upload_id = None
+                    upload_buffer.clear()
+                    upload_overflowed = False
+
+            async def send_action_error(message, value):
+                payload = {"type": "error", "message": message}
+                if _is_ws_upload_value(value):
+                    # Lets the client fail that upload instead of waiting on it
+                    payload["uploadId"] = _ws_upload_id(value)
+                await ws.send_json(payload)
+
             async def process_message(data):
                 msg_type = data.get('type')
                 if msg_type != 'click' and msg_type != 'tick':
@@ -757,7 +888,7 @@ class AppRuntimeMixin:
                         native_token = data.get('_native_token')
                         if native_token != self.native_token:
                             self.debug_print(f"  [X] Native token mismatch!")
-                            await ws.send_json({"type": "error", "message": "Invalid native token"})
+                            await send_action_error("Invalid native token", data.get('value'))
                             return
                         else:
                             self.debug_print(f"  [OK] Native token valid - Skipping CSRF check")
@@ -766,12 +897,21 @@ class AppRuntimeMixin:
                             csrf_token = data.get('_csrf_token')
                             if not csrf_token or not self._verify_csrf_token(sid, csrf_token):
                                 self.debug_print(f"  [X] CSRF token invalid")
-                                await ws.send_json({"type": "error", "message": "Invalid CSRF token"})
+                                await send_action_error("Invalid CSRF token", data.get('value'))
                                 return
                             else:
                                 self.debug_print(f"  [OK] CSRF token valid")
 
                     cid, value = data.get('id'), data.get('value')
+                    action_value = value
+                    if _is_ws_upload_value(value):
+                        # Rejected uploads never reach the widget, so its state is untouched
+                        try:
+                            action_value = take_ws_upload(value)
+                        except ValueError as error:
+                            await send_action_error(str(error), value)
+                            return
+                        await ws.send_json({"type": "upload_ack", "uploadId": _ws_upload_id(value)})
                     store = get_session_store()
                     if value is not None:
                         store.setdefault('submitted_values', {})[cid] = value
@@ -788,7 +928,7 @@ class AppRuntimeMixin:
                         action_token = action_ctx.set(True)
                         pending_token = pending_shared_views_ctx.set(set())
                         try:
-                            action_callback(value) if value is not None else action_callback()
+                            action_callback(action_value) if action_value is not None else action_callback()
                         finally:
                             action_ctx.reset(action_token)
 
@@ -818,7 +958,29 @@ class AppRuntimeMixin:
             try:
                 while True:
                     try:
-                        data = await ws.receive_json()
+                        message = await ws.receive()
+                        if message["type"] == "websocket.disconnect":
+                            raise WebSocketDisconnect(message.get("code", 1000))
+                        chunk = message.get("bytes")
+                        if chunk is not None:
+                            # Raw file upload frame: 4-byte upload id, then file bytes
+                            if len(chunk) < 4:
+                                continue
+                            frame_id = int.from_bytes(chunk[:4], "big")
+                            if frame_id != upload_id:
+                                # Uploads are sent one at a time; a new id abandons the last
+                                upload_id = frame_id
+                                upload_buffer.clear()
+                                upload_overflowed = False
+                            if upload_overflowed:
+                                continue
+                            if len(upload_buffer) + len(chunk) - 4 > WS_UPLOAD_BUFFER_LIMIT:
+                                upload_buffer.clear()
+                                upload_overflowed = True
+                            else:
+                                upload_buffer.extend(memoryview(chunk)[4:])
+                            continue
+                        data = json.loads(message["text"])
                     except WebSocketDisconnect:
                         disconnect_reason = "disconnect"
                         break
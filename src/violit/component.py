@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Mapping, Optional
 import html
 import re
@@ -270,6 +271,16 @@ def is_allowed_public_attr(name: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=1024)
+def _classify_attr_name(raw_name: str) -> tuple[str, bool, bool]:
+    """Return (lowered name, is event handler, is allowed public attr) for a prop name."""
+    clean_name = normalize_component_attr_name(raw_name)
+    if not clean_name or not _SAFE_ATTR_NAME_RE.fullmatch(clean_name):
+        raise ValueError(f"Unsupported attribute name: {raw_name}")
+    lowered = clean_name.lower()
+    return lowered, bool(_EVENT_ATTR_RE.match(lowered)), is_allowed_public_attr(lowered)
+
+
 def normalize_public_component_props(
     props: Mapping[str, Any],
     *,
@@ -281,12 +292,9 @@ def normalize_public_component_props(
         if raw_name in _PRIVATE_PROP_KEYS or raw_name == "content":
             continue
 
-        clean_name = normalize_component_attr_name(str(raw_name))
-        if not clean_name or not _SAFE_ATTR_NAME_RE.fullmatch(clean_name):
-            raise ValueError(f"Unsupported attribute name: {raw_name}")
-
-        lowered = clean_name.lower()
-        if _EVENT_ATTR_RE.match(lowered):
+        # Name validation only depends on the name, so it is cached across renders
+        lowered, is_event, is_allowed = _classify_attr_name(str(raw_name))
+        if is_event:
             if allow_event_handlers:
                 normalized[lowered] = raw_value
                 continue
@@ -295,7 +303,7 @@ def normalize_public_component_props(
                 "Use the widget callback API instead."
             )
 
-        if not is_allowed_public_attr(lowered):
+        if not is_allowed:
             raise ValueError(f"Unsupported public widget attribute: {lowered}")
 
         if raw_value is None or raw_value is False:
@@ -322,19 +330,17 @@ def serialize_public_component_attrs(
 ) -> str:
     normalized = normalize_public_component_props(props, allow_event_handlers=allow_event_handlers)
     parts: list[str] = []
+    escape = html.escape
 
     for name, value in normalized.items():
         if value is True:
             parts.append(name)
         elif value is False or value is None:
             continue
+        elif allow_event_handlers and name.startswith("on") and _EVENT_ATTR_RE.match(name):
+            parts.append(f'{name}="{value}"')
         else:
-            raw_value = str(value)
-            if allow_event_handlers and _EVENT_ATTR_RE.match(name):
-                escaped_value = raw_value
-            else:
-                escaped_value = html.escape(raw_value, quote=True)
-            parts.append(f'{name}="{escaped_value}"')
+            parts.append(f'{name}="{escape(str(value), quote=True)}"')
 
     return " ".join(parts)
 
@@ -372,3 +378,26 @@ class Component:
         escaped_id = html.escape(str(self.id), quote=True)
         attr_suffix = f" {props_str}" if props_str else ""
         return f"<{self.tag} id=\"{escaped_id}\"{attr_suffix}>{content}</{self.tag}>"
+
+
+class RawHTML:
+    """Pre-rendered markup returned by a builder.
+
+    A lighter stand-in for ``Component(None, id=..., content=html)``: it has the
+    same ``id``/``render()`` surface the runtime uses, without the props dict.
+    """
+
+    __slots__ = ("id", "html")
+    tag = None
+    escape_content = False
+
+    def __init__(self, id, html: str):
+        self.id = id
+        self.html = html
+
+    @property
+    def props(self) -> dict[str, Any]:
+        return {"content": self.html}
+
+    def render(self) -> str:
+        return self.html
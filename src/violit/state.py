@@ -1,8 +1,10 @@
 import json
+import os
+import shutil
 import threading
 import time
 from typing import Any, Dict, Optional, Set, Tuple, cast
-from cachetools import TTLCache
+from cachetools import Cache, TTLCache
 from .context import action_ctx, pending_shared_views_ctx, session_ctx, view_ctx, rendering_ctx, app_instance_ref
 from .theme import Theme
 
@@ -87,11 +89,50 @@ class SharedDependencyTracker:
         for key in empty_keys:
             del self.subscribers[key]
 
+def discard_download_source(entry: Any) -> None:
+    """Delete the spooled temp file (and its directory) a download entry owns."""
+    if not isinstance(entry, dict) or not entry.get('owned'):
+        return
+    path = entry.get('path')
+    if path:
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+
+def _release_runtime_store(store: Any) -> None:
+    if not isinstance(store, dict):
+        return
+    for entry in list((store.get('_vl_download_sources') or {}).values()):
+        discard_download_source(entry)
+
+
+class _RuntimeStoreCache(TTLCache):
+    """TTLCache that releases a view store's temp files when the store is dropped."""
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _key, store in expired:
+            _release_runtime_store(store)
+        return expired
+
+    def __delitem__(self, key):
+        store = Cache.__getitem__(self, key)
+        try:
+            super().__delitem__(key)
+        finally:
+            _release_runtime_store(store)
+
+    def clear(self):
+        stores = [Cache.__getitem__(self, key) for key in list(Cache.__iter__(self))]
+        super().clear()
+        for store in stores:
+            _release_runtime_store(store)
+
+
 # Persistent store for static components (created during app initialization)
 STATIC_STORE = {}
 
 # TTL-cached store for per-view runtime state (expires after 6 hours [21600s] to survive mobile/PC long suspensions)
-VIEW_STORE = TTLCache(maxsize=4000, ttl=21600)
+VIEW_STORE = _RuntimeStoreCache(maxsize=4000, ttl=21600)
 
 # TTL-cached store for per-browser-session state (expires after 6 hours [21600s] to survive mobile/PC long suspensions)
 SESSION_STORE = TTLCache(maxsize=1000, ttl=21600)
@@ -134,6 +175,8 @@ def _create_runtime_store(base_count: int = 0) -> Dict[str, Any]:
         '_vl_chart_requested': set(),
         'toasts': [],
         'effects': [],
+        '_vl_media_sources': {},
+        '_vl_download_sources': {},
         'interval_callbacks': {},
         '_interval_count': 0,
     }
@@ -824,6 +824,81 @@
             run(0);
         });
 
+        violitRuntime.registerInitializer('select-slider', function(element) {
+            const config = violitRuntime.readJsonAttr(element, 'data-vl-select-slider-config', null);
+            if (!config || !config.cid || violitRuntime.markBound(element, `select-slider-${config.cid}`)) {
+                return;
+            }
+            const options = Array.isArray(config.options) ? config.options : [];
+            element.addEventListener('input', function() {
+                const display = document.getElementById(`${config.cid}_display`);
+                if (display) display.textContent = options[parseInt(element.value)];
+            });
+            element.addEventListener('change', function() {
+                window.sendAction(config.cid, element.value);
+            });
+        });
+
+        violitRuntime.registerInitializer('file-uploader', function(element) {
+            const config = violitRuntime.readJsonAttr(element, 'data-vl-file-uploader-config', null);
+            if (!config || !config.cid || violitRuntime.markBound(element, `file-uploader-${config.cid}`)) {
+                return;
+            }
+            const cid = config.cid;
+            const multiple = config.multiple === true;
+            const setInfo = function(text) {
+                const infoDiv = document.getElementById(`${cid}_info`);
+                if (infoDiv) infoDiv.textContent = text;
+            };
+            const uploadedText = function(files) {
+                return multiple
+                    ? 'Uploaded ' + files.length + ' file(s)'
+                    : 'Uploaded ' + files[0].name + ' (' + (files[0].size / 1024).toFixed(1) + ' KB)';
+            };
+            const fail = function(err) {
+                setInfo(err && err.message ? 'Upload failed: ' + err.message : 'Upload failed');
+                console.error('File upload error:', err);
+            };
+
+            element.addEventListener('change', function(e) {
+                const files = e.target.files;
+                if (!files || files.length === 0) {
+                    return;
+                }
+                setInfo('Uploading...');
+                const fileArray = Array.from(files);
+                if (window.sendAction && window._vlSendUpload) {
+                    // WebSocket mode: stream raw bytes as binary frames
+                    window._vlSendUpload(cid, fileArray, multiple).then(function() {
+                        setInfo(uploadedText(fileArray));
+                    }).catch(fail);
+                    return;
+                }
+                const readers = fileArray.map(function(file) {
+                    return new Promise(function(resolve, reject) {
+                        const reader = new FileReader();
+                        reader.onload = function(ev) {
+                            resolve({ name: file.name, type: file.type, size: file.size, content: ev.target.result });
+                        };
+                        reader.onerror = reject;
+                        reader.readAsDataURL(file);
+                    });
+                });
+                Promise.all(readers).then(function(results) {
+                    const payload = multiple ? { files: results } : results[0];
+                    setInfo(uploadedText(results));
+                    if (window.sendAction) {
+                        window.sendAction(cid, payload);
+                    } else if (window.htmx) {
+                        htmx.ajax('POST', `/action/${cid}`, {
+                            values: { value: JSON.stringify(payload) },
+                            swap: 'none',
+                        });
+                    }
+                }).catch(fail);
+            });
+        });
+
         violitRuntime.registerInitializer('expander-persistence', function(element) {
             const config = violitRuntime.readJsonAttr(element, 'data-vl-expander-config', null);
             if (!config || !config.storageKey) {
@@ -3315,22 +3390,7 @@
                 window._vlAllowFocusedUpdates[cid] = true;
             };
 
-            window.sendAction = (cid, val) => {
-                debugLog(`[sendAction] Called with cid=${cid}, val=${val}`);
-
-                if (val && typeof val === 'object' && val.eventType === 'submit') {
-                    window._vlAllowNextFocusedUpdate(cid);
-                }
-
-                if (cid.startsWith('nav_menu')) {
-                    if (window._pendingPageKey === val || window._currentPageKey === val) {
-                        debugLog(`[sendAction] Skipping duplicate navigation for ${val}`);
-                        return;
-                    }
-                }
-
-                window._pendingScrollRestore = captureViewportScroll();
-                
+            const buildActionPayload = (cid, val) => {
                 const payload = {
                     type: 'click',
                     id: cid,
@@ -3349,6 +3409,26 @@
                 if (nativeToken) {
                     payload._native_token = nativeToken;
                 }
+                return payload;
+            };
+
+            window.sendAction = (cid, val) => {
+                debugLog(`[sendAction] Called with cid=${cid}, val=${val}`);
+
+                if (val && typeof val === 'object' && val.eventType === 'submit') {
+                    window._vlAllowNextFocusedUpdate(cid);
+                }
+
+                if (cid.startsWith('nav_menu')) {
+                    if (window._pendingPageKey === val || window._currentPageKey === val) {
+                        debugLog(`[sendAction] Skipping duplicate navigation for ${val}`);
+                        return;
+                    }
+                }
+
+                window._pendingScrollRestore = captureViewportScroll();
+                
+                const payload = buildActionPayload(cid, val);
                 
                 if (cid.startsWith('nav_menu')) {
                     if (window._currentPageKey) {
@@ -3390,6 +3470,61 @@
                 }
             };
 
+            // Streams files to the server as raw binary frames (1 MiB slices),
+            // then sends the action with only their metadata. Every frame starts
+            // with a 4-byte upload id so actions sent meanwhile cannot disturb
+            // the upload, and uploads are chained so their frames never interleave.
+            // Frames and metadata must share one socket: the server buffers frames
+            // per connection, so the metadata is sent directly (never queued for
+            // replay) and the upload fails if the socket was replaced meanwhile.
+            // The returned promise settles on the server's upload_ack or error.
+            window._vlPendingUploads = window._vlPendingUploads || {};
+            window._vlSendUpload = (cid, files, multiple) => {
+                const run = async () => {
+                    const socket = window._ws;
+                    const ensureSocket = () => {
+                        if (!socket || socket !== window._ws || socket.readyState !== WebSocket.OPEN) {
+                            throw new Error('WebSocket closed or replaced during upload');
+                        }
+                    };
+                    ensureSocket();
+                    window._vlUploadSeq = ((window._vlUploadSeq || 0) + 1) >>> 0;
+                    const uploadId = window._vlUploadSeq;
+                    const header = new Uint8Array(4);
+                    new DataView(header.buffer).setUint32(0, uploadId);
+                    const chunkSize = 1 << 20;
+                    const meta = [];
+                    for (const file of files) {
+                        for (let offset = 0; offset < file.size; offset += chunkSize) {
+                            const frame = await new Blob([header, file.slice(offset, offset + chunkSize)]).arrayBuffer();
+                            ensureSocket();
+                            socket.send(frame);
+                        }
+                        meta.push({ name: file.name, type: file.type, size: file.size });
+                    }
+                    ensureSocket();
+                    const settled = new Promise((resolve, reject) => {
+                        const onClose = () => {
+                            delete window._vlPendingUploads[uploadId];
+                            reject(new Error('WebSocket closed before the upload was confirmed'));
+                        };
+                        socket.addEventListener('close', onClose, { once: true });
+                        window._vlPendingUploads[uploadId] = (error) => {
+                            delete window._vlPendingUploads[uploadId];
+                            socket.removeEventListener('close', onClose);
+                            if (error) reject(error); else resolve();
+                        };
+                    });
+                    socket.send(JSON.stringify(buildActionPayload(cid, {
+                        _vl_upload: { id: uploadId, files: meta, multiple: !!multiple }
+                    })));
+                    await settled;
+                };
+                const next = (window._vlUploadChain || Promise.resolve()).then(run, run);
+                window._vlUploadChain = next.catch(() => {});
+                return next;
+            };
+
             window._vlBuildHardReloadUrl = () => {
                 const url = new URL(window.location.href);
                 url.searchParams.set(reloadParamName, Date.now().toString());
@@ -3760,6 +3895,13 @@
                     if (msg.type === 'pong') {
                         return;
                     }
+                    if (msg.type === 'upload_ack' || (msg.type === 'error' && msg.uploadId != null)) {
+                        const settle = window._vlPendingUploads && window._vlPendingUploads[msg.uploadId];
+                        if (settle) {
+                            settle(msg.type === 'error' ? new Error(msg.message || 'Upload failed') : null);
+                        }
+                        return;
+                    }
                     if(msg.type === 'update') {
                         // Check if this is a navigation update (page transition)
                         // Server sends isNavigation flag based on action type
@@ -4242,6 +4384,16 @@
             }
         }
         
+        // WS transport for native change-driven inputs (date/time/color pickers).
+        // One delegated listener instead of an inline handler per widget.
+        document.addEventListener('change', function(e) {
+            const target = e.target;
+            const cid = target && target.dataset ? target.dataset.vlChangeAction : '';
+            if (cid && typeof window.sendAction === 'function') {
+                window.sendAction(cid, target.value);
+            }
+        });
+
         // Auto-close sidebar on mobile after nav button click
         document.addEventListener('click', function(e) {
             const btn = e.target.closest('#sidebar wa-button');
@@ -4423,6 +4575,16 @@
         }
 
         window._vlExecuteClientCommand = executeClientCommand;
+
+        // Shared click handler for web-mode download buttons. The payload lives
+        // in data attributes, so buttons do not need their own <script> block.
+        window._vlDownloadFromElement = function(el) {
+            if (!el) return;
+            runDownloadCommand({
+                href: el.getAttribute('data-vl-download-href') || '',
+                fileName: el.getAttribute('data-vl-download-name') || '',
+            });
+        };
         
         // Restore state from URL Hash (or force Home if no hash)
         function restoreFromHash() {
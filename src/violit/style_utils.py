@@ -5,6 +5,7 @@ Provides merge helpers for cls (class) and style (inline CSS) parameters.
 
 import html as html_lib
 import json
+from functools import lru_cache
 
 from .component import class_string_needs_tailwind_wait, sanitize_inline_style
 
@@ -362,8 +363,8 @@ def merge_style(*style_strings: str) -> str:
                 if not stripped.endswith(";"):
                     stripped += ";"
                 parts.append(stripped)
-    result = " ".join(parts)
-    return result.strip()
+    # Every part is already stripped, so the joined result needs no strip()
+    return " ".join(parts)
 
 
 def merge_part_cls(*part_maps):
@@ -595,7 +596,22 @@ def auto_split_widget_cls(widget_type: str, class_string: str):
     part_name = AUTO_PART_WIDGETS.get(widget_type)
     if not part_name or not class_string:
         return merge_cls(class_string), {}
+    if not isinstance(class_string, str):
+        return _split_widget_cls(part_name, class_string)
+
+    # Widget cls strings are almost always literals that repeat across
+    # renders, so the tokenizer/classifier result is memoized.
+    host_cls, part_items = _split_widget_cls_cached(widget_type, class_string)
+    return host_cls, dict(part_items)
+
+
+@lru_cache(maxsize=4096)
+def _split_widget_cls_cached(widget_type: str, class_string: str):
+    host_cls, part_map = _split_widget_cls(AUTO_PART_WIDGETS[widget_type], class_string)
+    return host_cls, tuple(part_map.items())
+
 
+def _split_widget_cls(part_name, class_string: str):
     if isinstance(part_name, str):
         host_tokens = []
         part_tokens = []
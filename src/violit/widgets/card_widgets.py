@@ -3,8 +3,11 @@ Card Widgets - Web Awesome Card Components
 Provides easy-to-use wrappers for Web Awesome card components
 """
 
+import itertools
+
 from ..component import Component
 from ..context import rendering_ctx
+from ..state import get_session_store
 from ..style_utils import merge_cls, merge_style, resolve_value
 
 
@@ -591,7 +594,6 @@ class CardContext:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         from ..context import layout_ctx, fragment_ctx
-        from ..state import get_session_store
         
         # Build final card HTML - collect components at render time
         def builder():
@@ -599,14 +601,14 @@ class CardContext:
             token = rendering_ctx.set(self.cid)
             
             try:
-                # Collect components added inside this card context
-                card_components = []
-                # Check static fragment components
-                for cid_child, b in self.app.static_fragment_components.get(self.cid, []):
-                    card_components.append(b().render())
-                # Check session fragment components
-                for cid_child, b in store['fragment_components'].get(self.cid, []):
-                    card_components.append(b().render())
+                # Collect components added inside this card context (static first, then session)
+                card_components = [
+                    b().render()
+                    for _, b in itertools.chain(
+                        self.app.static_fragment_components.get(self.cid, ()),
+                        store['fragment_components'].get(self.cid, ()),
+                    )
+                ]
                 
                 # Handle callable header and footer (Lambda support)
                 current_header = self.header
@@ -1192,13 +1192,13 @@ class ChatWidgetsMixin:
                     htmls = []
                     seen_child_ids = set()
                     # Check static
-                    for cid_child, b in self.app.static_fragment_components.get(self.message_id, []):
+                    for cid_child, b in self.app.static_fragment_components.get(self.message_id, ()):
                         if cid_child in seen_child_ids:
                             continue
                         seen_child_ids.add(cid_child)
                         htmls.append(b().render())
                     # Check session
-                    for cid_child, b in store['fragment_components'].get(self.message_id, []):
+                    for cid_child, b in store['fragment_components'].get(self.message_id, ()):
                         if cid_child in seen_child_ids:
                             continue
                         seen_child_ids.add(cid_child)
@@ -6,11 +6,86 @@ import hashlib
 import inspect
 import json
 import re
+from datetime import date as date_obj, timedelta
 from ..component import Component
 from ..context import initial_render_ctx, rendering_ctx
 from ..state import State
 from ..style_utils import merge_cls, merge_style, resolve_value
 
+# orjson is an optional accelerator for grid payload (de)serialization
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _loads_json_payload(payload):
+    """Parse a JSON payload from str/bytes, using orjson when available."""
+    if _orjson is not None:
+        return _orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Integer range orjson can encode (signed and unsigned 64-bit)
+_ORJSON_MIN_INT = -(1 << 63)
+_ORJSON_MAX_INT = (1 << 64) - 1
+
+
+def _orjson_safe(obj) -> bool:
+    """True when orjson encodes obj to the same values as json.dumps(obj, default=str).
+
+    Only dicts with str keys, lists/tuples and plain str/int/float/bool/None
+    qualify. NaN/Inf, ints beyond 64 bits and anything json would pass to
+    default=str (datetimes, numpy scalars, enums, subclasses) do not.
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is str or value_type is bool or value is None:
+            continue
+        if value_type is float:
+            if value - value == 0.0:
+                continue
+            return False
+        if value_type is int:
+            if _ORJSON_MIN_INT <= value <= _ORJSON_MAX_INT:
+                continue
+            return False
+        if value_type is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            stack.extend(value.values())
+            continue
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+            continue
+        return False
+    return True
+
+
+def _dumps_json_payload(obj) -> str:
+    """Serialize grid row/column data like json.dumps(obj, default=str).
+
+    orjson is used only for payloads it encodes identically; everything else
+    (and anything orjson rejects, such as lone surrogates) goes through json.
+    """
+    if _orjson is not None and _orjson_safe(obj):
+        try:
+            return _orjson.dumps(obj).decode("utf-8")
+        except _orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, default=str)
+
+
+# (label, color_map key, fallback color) for the heatmap legend
+_HEATMAP_LEGEND_ENTRIES = (
+    ('None', 0, '#ebedf0'),
+    ('Done', 1, '#10b981'),
+    ('Skip', 2, '#fbbf24'),
+)
+
 
 class DataWidgetsMixin:
     """Data display widgets (dataframe, table, data_editor, metric, json)"""
@@ -668,8 +743,8 @@ class DataWidgetsMixin:
                 script_body=f'''
                 function initGrid() {{
                     const opt = {{ 
-                        columnDefs: {json.dumps(cols, default=str)}, 
-                        rowData: {json.dumps(data, default=str)},
+                        columnDefs: {_dumps_json_payload(cols)}, 
+                        rowData: {_dumps_json_payload(data)},
                         defaultColDef: {{flex: 1, minWidth: 100, resizable: true, editable: false}},
                         suppressScrollOnNewData: true,
                         {cell_click_handler}
@@ -721,24 +796,47 @@ class DataWidgetsMixin:
         
         self._register_component(cid, builder, action=action if on_cell_clicked else None)
 
+    @staticmethod
+    def _build_table_html(df) -> str:
+        """Render a DataFrame as a plain HTML table without pandas' formatter."""
+        escape = html_lib.escape
+        head = ''.join(f'<th>{escape(str(c))}</th>' for c in df.columns.tolist())
+        # Missing floats read "NaN" like to_html(); None/NA/NaT keep their str()
+        missing = df.isna().to_numpy()
+        body = ''.join(
+            '<tr>' + ''.join(
+                '<td>NaN</td>' if is_missing and isinstance(v, float) else f'<td>{escape(str(v))}</td>'
+                for v, is_missing in zip(row, missing_row)
+            ) + '</tr>'
+            for row, missing_row in zip(df.to_numpy(dtype=object), missing)
+        )
+        return (
+            '<table class="dataframe data-table">'
+            f'<thead><tr>{head}</tr></thead>'
+            f'<tbody>{body}</tbody>'
+            '</table>'
+        )
+
     def table(self, df: Union['pd.DataFrame', Callable, State], cls: str = "", style: str = "", **props):
         """Display static HTML table (Signal support)"""
         cid = self._get_next_cid("table")
         def builder():
             import pandas as pd
             # Handle Signal
-            token = rendering_ctx.set(cid)
-            try:
-                current_df = resolve_value(df)
-            finally:
-                rendering_ctx.reset(token)
+            current_df = df
+            if callable(df):
+                token = rendering_ctx.set(cid)
+                try:
+                    current_df = resolve_value(df)
+                finally:
+                    rendering_ctx.reset(token)
             
             if not isinstance(current_df, pd.DataFrame):
                 try: current_df = pd.DataFrame(current_df)
                 except: return Component("div", id=cid, content="Invalid data format")
 
             # Convert dataframe to HTML table
-            html_table = current_df.to_html(index=False, border=0, classes=['data-table'])
+            html_table = self._build_table_html(current_df)
             styled_html = f'''
             <div style="overflow-x:auto;border:1px solid var(--vl-border);border-radius:0.5rem;">
                 <style>
@@ -858,7 +956,7 @@ class DataWidgetsMixin:
         
         def action(v):
             try:
-                payload = json.loads(v) if isinstance(v, str) else v
+                payload = _loads_json_payload(v) if isinstance(v, (str, bytes, bytearray)) else v
                 previous_store_value = self._clone_editor_state_value(s.value)
                 previous_data = self._coerce_editor_records(s.value)
                 event_payload = payload if isinstance(payload, dict) else {"eventType": "full_sync", "allData": payload}
@@ -1059,8 +1157,8 @@ class DataWidgetsMixin:
                 bottom_html=bottom_html,
                 grid_config_hash=grid_config_hash,
                 script_body=f'''
-                const rawColumnDefs = {json.dumps(cols, default=str)};
-                const initialRowData = {json.dumps(data, default=str)};
+                const rawColumnDefs = {_dumps_json_payload(cols)};
+                const initialRowData = {_dumps_json_payload(data)};
                 const extraGridOptions = {json.dumps(extra_options, default=str)};
 
                 function postEditorAction(payload) {{
@@ -1409,13 +1507,15 @@ class DataWidgetsMixin:
         cid = self._get_next_cid("metric")
         
         def builder():
-            # Handle value and delta signals in a single tracked block
-            token = rendering_ctx.set(cid)
+            # Handle value and delta signals in a single tracked block;
+            # plain values need no subscription scope at all.
+            token = rendering_ctx.set(cid) if (callable(value) or callable(delta)) else None
             try:
                 curr_val = resolve_value(value)
                 curr_delta = resolve_value(delta) if delta is not None else None
             finally:
-                rendering_ctx.reset(token)
+                if token is not None:
+                    rendering_ctx.reset(token)
 
             # XSS protection: escape all values
             escaped_label = html_lib.escape(str(label))
@@ -1478,19 +1578,16 @@ class DataWidgetsMixin:
         cid = self._get_next_cid("json")
         
         def builder():
-            from ..state import State, ComputedState
             import json as json_lib
             
             # Handle Signal
             current_body = body
-            if isinstance(body, (State, ComputedState)):
+            if callable(body):
                 token = rendering_ctx.set(cid)
-                current_body = body.value
-                rendering_ctx.reset(token)
-            elif callable(body):
-                token = rendering_ctx.set(cid)
-                current_body = body()
-                rendering_ctx.reset(token)
+                try:
+                    current_body = resolve_value(body)
+                finally:
+                    rendering_ctx.reset(token)
                 
             json_str = json_lib.dumps(current_body, indent=2, default=str)
             html = f'''
@@ -1535,8 +1632,6 @@ class DataWidgetsMixin:
                 color_map={0: '#ebedf0', 1: '#10b981', 2: '#fbbf24'}
             )
         """
-        from datetime import date as date_obj, timedelta
-        
         cid = self._get_next_cid("heatmap")
         
         def action(v):
@@ -1547,14 +1642,12 @@ class DataWidgetsMixin:
         def builder():
             # Handle Signal/Callable
             current_data = data
-            if isinstance(data, State):
-                token = rendering_ctx.set(cid)
-                current_data = data.value
-                rendering_ctx.reset(token)
-            elif callable(data):
+            if callable(data):
                 token = rendering_ctx.set(cid)
-                current_data = data()
-                rendering_ctx.reset(token)
+                try:
+                    current_data = resolve_value(data)
+                finally:
+                    rendering_ctx.reset(token)
             
             # Parse dates
             if start_date:
@@ -1678,6 +1771,11 @@ class DataWidgetsMixin:
                 </div>
                 '''
             
+            # Dense lookup table for small non-negative int values (the common case)
+            int_keys = [k for k in current_color_map if type(k) is int and 0 <= k < 256]
+            palette = [current_color_map.get(i, '#ebedf0') for i in range(max(int_keys) + 1)] if int_keys else []
+            palette_size = len(palette)
+
             # Generate weeks HTML
             today = date_obj.today()
             current_month = None
@@ -1700,7 +1798,10 @@ class DataWidgetsMixin:
                         cells_html.append(f'<div style="width: {cell_size}px; height: {cell_size}px;"></div>')
                     else:
                         value = day['value']
-                        bg_color = current_color_map.get(value, '#ebedf0')
+                        if type(value) is int and 0 <= value < palette_size:
+                            bg_color = palette[value]
+                        else:
+                            bg_color = current_color_map.get(value, '#ebedf0')
                         is_today = day['date'] == today
                         today_class = ' today' if is_today else ''
                         date_str = day['date'].isoformat()
@@ -1725,15 +1826,18 @@ class DataWidgetsMixin:
             # Legend
             legend_html = ''
             if show_legend:
+                color_values = set(current_color_map.values())
+                legend_entries = [
+                    (label, current_color_map.get(key, default_color))
+                    for label, key, default_color in _HEATMAP_LEGEND_ENTRIES
+                ]
                 legend_items = [
                     f'''<div class="legend-item">
                         <div class="cell" style="background: {color}; border: 1px solid #ddd;"></div>
                         <span>{label}</span>
                     </div>'''
-                    for label, color in [('None', current_color_map.get(0, '#ebedf0')), 
-                                         ('Done', current_color_map.get(1, '#10b981')), 
-                                         ('Skip', current_color_map.get(2, '#fbbf24'))]
-                    if color in current_color_map.values()
+                    for label, color in legend_entries
+                    if color in color_values
                 ]
                 legend_html = f'''
                 <div class="legend">
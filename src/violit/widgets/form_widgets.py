@@ -1,12 +1,251 @@
 """Form Widgets Mixin for Violit"""
 
+import base64
 import hashlib
+import html as html_lib
+import itertools
+import logging
+import os
 import re
+import shutil
+import tempfile
+import uuid
 from typing import Any, Union, Callable, Optional
 from ..component import Component
-from ..context import rendering_ctx, fragment_ctx
-from ..state import get_session_store
+from ..context import action_ctx, rendering_ctx, fragment_ctx, session_ctx
+from ..state import discard_download_source, get_session_store
 from ..style_utils import auto_split_widget_cls, merge_cls, merge_style, merge_part_cls, serialize_part_cls
+from .media_widgets import _media_public_url, _view_scoped_url
+
+# pybase64 (SIMD base64 codec) is used when installed; stdlib base64 otherwise
+try:
+    import pybase64 as _pybase64
+except ImportError:
+    _pybase64 = None
+
+logger = logging.getLogger("violit.widgets")
+
+# Data URLs inflate payloads by ~33%; above this size save_file() is preferable
+_DATA_URL_WARN_BYTES = 64 * 1024
+# download_file() payloads above this size are served from a temp file instead
+_DATA_URL_MAX_BYTES = 1 << 20
+_STREAM_CHUNK_SIZE = 1 << 20
+# One-shot download_file() entries a view keeps before the oldest unserved one is dropped
+_MAX_PENDING_DOWNLOADS = 16
+
+
+def _to_bytes(data) -> bytes:
+    """Convert an in-memory download/save payload (not a file-like) to bytes."""
+    data_type = type(data)
+    if data_type is bytes:
+        return data
+    if data_type is str:
+        return data.encode('utf-8')
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    return str(data).encode('utf-8')
+
+
+def _copy_stream(src, dst, chunk_size: int = _STREAM_CHUNK_SIZE) -> None:
+    """Copy a (binary or text) file-like object into a binary file in chunks."""
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        dst.write(chunk)
+
+
+def _write_file_bytes(path: str, data_bytes: bytes) -> None:
+    """Write a whole payload with raw os.write() calls, skipping BufferedWriter."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data_bytes)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _spool_to_temp(head: bytes, stream, file_name: str) -> str:
+    """Write a download payload to a temp file and return its path."""
+    temp_dir = tempfile.mkdtemp(prefix="violit_download_")
+    path = os.path.join(temp_dir, os.path.basename(str(file_name)) or "download")
+    with open(path, "wb") as f:
+        f.write(head)
+        if stream is not None:
+            _copy_stream(stream, f)
+    return path
+
+
+def _b64encode_str(data_bytes: bytes) -> str:
+    if _pybase64 is not None:
+        return _pybase64.b64encode_as_string(data_bytes)
+    return base64.b64encode(data_bytes).decode('ascii')
+
+
+_CENTER_FLEX_STYLE = "display:flex; justify-content:center;"
+
+_LINK_BUTTON_TMPL = (
+    '<wa-button variant="brand" appearance="accent" href="{url}" target="_blank" with-start{flags}>'
+    '{icon_html}{icon_emoji}{label}'
+    '</wa-button>'
+)
+
+_PAGE_LINK_STYLE = (
+    "display:inline-flex;align-items:center;gap:0.5rem;color:var(--vl-primary);"
+    "text-decoration:none;padding:0.5rem 1rem;border-radius:0.25rem;transition:background 0.2s;"
+)
+_PAGE_LINK_DISABLED_STYLE = _PAGE_LINK_STYLE + "pointer-events:none;opacity:0.5;"
+
+_PAGE_LINK_TMPL = '<a href="{page}" style="{link_style}">{icon_html}{label}</a>'
+
+_FORM_SUBMIT_TMPL = (
+    '<wa-button type="submit" variant="{variant}" appearance="{appearance}" with-start{flags} {attrs}>'
+    '{icon_html}{label}'
+    '</wa-button>'
+)
+
+_DOWNLOAD_BUTTON_WEB_TMPL = (
+    '<wa-button variant="brand" appearance="accent" data-vl-download-href="{href}" '
+    'data-vl-download-name="{file_name}" onclick="window._vlDownloadFromElement(this)">'
+    '<wa-icon slot="start" name="download"></wa-icon>{label}'
+    '</wa-button>'
+)
+
+# Native Mode posts the click as an action; {attrs} comes from App._click_attrs()
+_DOWNLOAD_BUTTON_NATIVE_TMPL = (
+    '<wa-button variant="brand" appearance="accent" {attrs}>'
+    '<wa-icon slot="start" name="download"></wa-icon>{label}'
+    '</wa-button>'
+)
+
+# App methods bound onto FormContext instances (anything else still falls
+# back to FormContext.__getattr__)
+_FORM_DELEGATED_METHODS = (
+    "text_input",
+    "text_area",
+    "number_input",
+    "selectbox",
+    "multiselect",
+    "radio",
+    "checkbox",
+    "toggle",
+    "slider",
+    "date_input",
+    "time_input",
+    "color_picker",
+    "file_uploader",
+    "button",
+    "form_submit_button",
+    "write",
+    "markdown",
+    "text",
+    "columns",
+)
+
+
+def _attr(value) -> str:
+    """Escape a value for use inside a double-quoted HTML attribute."""
+    return html_lib.escape(str(value), quote=True)
+
+
+def _text(value) -> str:
+    """Escape a value for use as HTML text content."""
+    return html_lib.escape(str(value), quote=False)
+
+
+def _button_icon_parts(icon) -> tuple[str, str]:
+    """Split a button icon into (<wa-icon> markup, emoji prefix)."""
+    if not icon:
+        return "", ""
+    if any(ord(c) > 127 for c in str(icon)):
+        return "", f"{icon} "
+    return f'<wa-icon slot="start" name="{_attr(icon)}"></wa-icon>', ""
+
+
+def _button_flag_attrs(disabled: bool, use_container_width: bool) -> str:
+    return (" disabled" if disabled else "") + (' style="width:100%;"' if use_container_width else "")
+
+
+def _button_size_style(use_container_width: bool, height) -> str:
+    host_style = "width:100%;" if use_container_width else ""
+    if height not in (None, "", "auto"):
+        if height == "fill":
+            host_style = merge_style(host_style, "height:100%;")
+        elif isinstance(height, (int, float)):
+            host_style = merge_style(host_style, f"height:{int(height)}px;")
+        else:
+            host_style = merge_style(host_style, f"height:{height};")
+    return host_style
+
+
+# pywebview module once resolved (None when not installed); False = not tried yet
+_webview = False
+# Set once a pywebview window has been seen; the process exits when it closes
+_NATIVE_MODE = False
+
+
+def _get_webview():
+    """Return the pywebview module, or None when it is unavailable.
+
+    Imported lazily (pywebview is slow to import) and bound at module level.
+    """
+    global _webview
+    if _webview is False:
+        try:
+            import webview as _webview_module
+        except ImportError:
+            _webview_module = None
+        _webview = _webview_module
+    return _webview
+
+
+def _is_native() -> bool:
+    """True when a pywebview window is open (Native mode)."""
+    global _NATIVE_MODE
+    if _NATIVE_MODE:
+        return True
+    webview = _get_webview()
+    if webview is not None and len(webview.windows) > 0:
+        _NATIVE_MODE = True
+    return _NATIVE_MODE
+
+
+def _encode_data_url(data_bytes: bytes, mime: str) -> str:
+    """Build a base64 data URL for a download payload."""
+    return f"data:{mime};base64,{_b64encode_str(data_bytes)}"
+
+
+def _download_public_url(app, download_id: str, data_bytes: Optional[bytes], data_path: Optional[str],
+                         file_name: str, mime: str, once: bool = False, owned: bool = False) -> str:
+    """Register a download payload for the current view and return its URL.
+
+    The payload is either in memory (data_bytes) or spooled to disk (data_path).
+    Outside a session there is no store to serve from, so a data URL is used.
+    A ``once`` entry is dropped after it is served; an ``owned`` spooled file
+    is deleted when its entry is replaced or the view store is released.
+    """
+    if session_ctx.get() is None:
+        if data_bytes is None:
+            return _media_public_url(app, data_path, mime)
+        return _encode_data_url(data_bytes, mime)
+
+    registry = get_session_store()["_vl_download_sources"]
+    if once:
+        pending = [key for key, entry in registry.items() if entry.get("once")]
+        overflow = len(pending) - _MAX_PENDING_DOWNLOADS + 1
+        for stale_id in pending[:max(overflow, 0)]:
+            discard_download_source(registry.pop(stale_id, None))
+    previous = registry.get(download_id)
+    if previous is not None and previous.get("path") != data_path:
+        discard_download_source(previous)
+    registry[download_id] = {"data": data_bytes, "path": data_path, "mime": mime, "name": str(file_name),
+                             "once": once, "owned": owned}
+    return _view_scoped_url(app._public_path(f"/__violit_download/{download_id}"))
 
 
 class FormWidgetsMixin:
@@ -31,6 +270,20 @@ class FormWidgetsMixin:
             return self._get_next_cid(prefix)
         return f"{prefix}_{self._sanitize_widget_key(key)}"
 
+    def _merge_widget_cls_style(self, widget_type: str, cls: str, style: str, base_style: str):
+        _wd = self._get_widget_defaults(widget_type)
+        return (
+            merge_cls(_wd.get("cls", ""), cls),
+            merge_style(base_style, _wd.get("style", ""), style),
+        )
+
+    def _resolved_cls_style(self, widget_type: str, cls: str, style: str, base_style: str = ""):
+        """Merge configure_widget defaults with per-call cls/style (memoized).
+
+        The LRU cache is cleared by configure_widget whenever the defaults change.
+        """
+        return self._widget_style_cache(widget_type, cls, style, base_style)
+
     @staticmethod
     def _wa_button_theme(variant: str):
         variant_map = {
@@ -64,43 +317,63 @@ class FormWidgetsMixin:
 
         cid = self._resolve_widget_cid("btn", key)
         user_part_cls = props.pop("part_cls", None)
+
+        # Everything below depends only on call-time arguments, so it is
+        # computed once here instead of on every render.
+        theme_variant, appearance = self._wa_button_theme(_variant)
+        icon_html, icon_emoji = _button_icon_parts(icon)
+        user_host_cls, user_auto_part_cls = auto_split_widget_cls("button", cls)
+        fill_cls = "vl-button-fill" if height == "fill" else ""
+        size_style = _button_size_style(use_container_width, height)
+        if disabled:
+            # Rendered as a bare boolean attribute by Component.
+            props["disabled"] = True
+
+        # With static text the markup only changes when the widget defaults or
+        # the engine mode do, so the last render is reused while both match.
+        # The mode is checked per render: app.run() may still switch it
+        # after declaration.
+        static_text = not callable(text)
+        rendered_cache = {}
+
         def builder():
-            token = rendering_ctx.set(cid)
-            bt = text() if callable(text) else text
-            rendering_ctx.reset(token)
-            attrs = self.engine.click_attrs(cid)
-            theme_variant, appearance = self._wa_button_theme(_variant)
-            icon_html = f'<wa-icon slot="start" name="{icon}"></wa-icon>' if icon and not any(ord(c) > 127 for c in str(icon)) else ''
-            icon_emoji = f'{icon} ' if icon and any(ord(c) > 127 for c in str(icon)) else ''
-            disabled_attr = 'disabled' if disabled else ''
             _wd = self._get_widget_defaults("button")
+            if static_text:
+                if (rendered_cache and rendered_cache["mode"] == self.mode
+                        and rendered_cache["defaults"] == _wd):
+                    return Component(None, id=cid, content=rendered_cache["html"])
+                bt = text
+            else:
+                token = rendering_ctx.set(cid)
+                bt = text()
+                rendering_ctx.reset(token)
             default_host_cls, default_auto_part_cls = auto_split_widget_cls("button", _wd.get("cls", ""))
-            user_host_cls, user_auto_part_cls = auto_split_widget_cls("button", cls)
-            _fc = merge_cls(default_host_cls, user_host_cls, "vl-button-fill" if height == "fill" else "")
+            _fc = merge_cls(default_host_cls, user_host_cls, fill_cls)
             _fs = merge_style(_wd.get("style", ""), style)
             _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
-            host_style = _fs
-            if use_container_width:
-                host_style = merge_style(host_style, "width:100%;")
-            if height not in (None, "", "auto"):
-                if height == "fill":
-                    host_style = merge_style(host_style, "height:100%;")
-                elif isinstance(height, (int, float)):
-                    host_style = merge_style(host_style, f"height:{int(height)}px;")
-                else:
-                    host_style = merge_style(host_style, f"height:{height};")
-            host_props = dict(props)
+            host_style = merge_style(_fs, size_style)
+            attrs = self._click_attrs(cid)[0]
+            # props is this call's own **kwargs dict and is not touched after
+            # declaration, so it is only copied when part-class attributes
+            # must be layered on.
+            host_props = props
             if _part_cls:
-                host_props["data_vl_part_cls"] = serialize_part_cls(_part_cls)
-                host_props["data_vl_init"] = "part-bridge"
+                host_props = {
+                    **props,
+                    "data_vl_part_cls": serialize_part_cls(_part_cls),
+                    "data_vl_init": "part-bridge",
+                }
             inner = Component("wa-button", id=cid, content=f"{icon_html}{icon_emoji}{bt}",
                               class_=_fc or None, style=host_style or None,
                               variant=theme_variant, appearance=appearance,
                               with_start=bool(icon_html) or None, **attrs, **host_props)
-            # Inject disabled attribute manually since Component may not handle it
+            if not static_text:
+                # Rendered once by the caller; no need to pre-render and wrap
+                return inner
             inner_html = inner.render()
-            if disabled:
-                inner_html = inner_html.replace(f'id="{cid}"', f'id="{cid}" disabled', 1)
+            rendered_cache["mode"] = self.mode
+            rendered_cache["defaults"] = dict(_wd)
+            rendered_cache["html"] = inner_html
             return Component(None, id=cid, content=inner_html)
         self._register_component(cid, builder, action=on_click)
 
@@ -121,142 +394,99 @@ class FormWidgetsMixin:
             icon: Icon name or emoji
         """
         cid = self._resolve_widget_cid("download_btn", key)
-        
-        def builder():
-            import base64
-            
-            # Convert data to downloadable format
-            if isinstance(data, str):
-                data_bytes = data.encode('utf-8')
-            elif isinstance(data, bytes):
-                data_bytes = data
-            else:
-                # Try to convert to string
-                data_bytes = str(data).encode('utf-8')
-            
-            # Create data URL
-            data_base64 = base64.b64encode(data_bytes).decode('utf-8')
-            data_url = f"data:{mime};base64,{data_base64}"
-            
-            # Check for Native Mode (pywebview)
-            is_native = False
+        label_html = _text(label)
+
+        # Convert data to downloadable format once; the payload is fixed for this button.
+        # File-like objects are streamed to a temp file instead of being read whole.
+        # Within a session the view owns that file: registering it under the cid
+        # right away deletes the one spooled by the previous run of this button.
+        data_path = None
+        spool_owned = False
+        if hasattr(data, 'read'):
+            data_bytes = None
+            data_path = _spool_to_temp(b"", data, file_name)
+            spool_owned = session_ctx.get() is not None
+            if spool_owned:
+                _download_public_url(self, cid, None, data_path, file_name, mime, owned=True)
+        else:
+            data_bytes = _to_bytes(data)
+
+        # Native Mode: server-side save dialog, registered as the click action
+        # by the builder. Defined once here rather than on every render.
+        def native_save_action(v=None):
             try:
-                import webview
-                if len(webview.windows) > 0:
-                    is_native = True
-            except ImportError:
-                pass
-                
-            if is_native:
-                # Native Mode: Use Server-Side Save Dialog
-                def native_save_action(v=None):
-                    try:
-                        import webview
-                        import os
-                        
-                        # Open Save Dialog
-                        # Open Save Dialog
-                        ext = file_name.split('.')[-1] if '.' in file_name else "*"
-                        file_types = (f"{ext.upper()} File (*.{ext})", "All files (*.*)")
-                        save_location = webview.windows[0].create_file_dialog(
-                            webview.SAVE_DIALOG, 
-                            save_filename=file_name,
-                            file_types=file_types
-                        )
-                        
-                        if save_location:
-                            if isinstance(save_location, list): save_location = save_location[0]
-                            with open(save_location, "wb") as f:
-                                f.write(data_bytes)
-                            
-                            # Toast is not easily accessible here without app reference or a way to push JS
-                            # But we can try pushing a toast if we are in a callback
-                            # For now, just print to console or rely on OS feedback (file created)
-                            print(f"[Native] Saved to {save_location}")
-                            
-                            # Try to trigger a success toast via eval if possible
-                            from ..state import get_session_store
-                            store = get_session_store()
-                            if 'toasts' not in store: store['toasts'] = []
-                            store['toasts'].append({"message": f"Saved to {os.path.basename(save_location)}", "variant": "success", "icon": "circle-check"})
-
-                    except Exception as e:
-                        print(f"[Native] Save failed: {e}")
-                
-                # Register the native save action
-                # We need to register it with the SAME cid
-                # NOTE: The outer _register_component calls with action=on_click (None). 
-                # We need to override that or use a different mechanism.
-                # Since we are inside builder, we can re-register or use a specific event handler?
-                # Actually, the simplest way is to overwrite the action in the store right here, 
-                # BUT builder is called during render. Registering action during render is tricky for the *current* cycle 
-                # if the component ID is already registered.
-                # However, this builder is run by the framework.
-                
-                # BETTER APPROACH: Set the onclick to sendAction
-                # and ensure the action mapped to this CID is our native_save_action.
-                
-                # We'll rely on the fact that if we provide an onclick behavior that sends action,
-                # we need the backend to execute native_save_action.
-                
-                # Let's monkey-patch the action for this specific instance if we can, 
-                # OR return a component that has the right onclick attribute.
-                
-                # In App.register_component, actions are stored.
-                # We can't easily change the registered action from *inside* the builder 
-                # because the registration happens *outside* usually (lines 51 self._register_component).
-                
-                # TRICK: We will not use the `on_click` argument passed to download_button for the native logic.
-                # Instead, we define the action wrapper here and stick it into the store manually? 
-                # Or we can just modify the way download_button registers itself.
-                pass 
-                
-            if is_native:
-                 # Override global action for this component to be the save dialog
-                 from ..state import get_session_store
-                 store = get_session_store()
-                 store['actions'][cid] = native_save_action
-                 
-                 # Check if we're in lite mode or ws mode
-                 if self.mode == 'lite':
-                     html = f'''
-                     <wa-button variant="brand" appearance="accent" hx-post="/action/{cid}" hx-swap="none" hx-trigger="click">
-                         <wa-icon slot="start" name="download"></wa-icon>
-                         {label}
-                     </wa-button>
-                     '''
-                 else:
-                     html = f'''
-                     <wa-button variant="brand" appearance="accent" onclick="window.sendAction('{cid}')">
-                         <wa-icon slot="start" name="download"></wa-icon>
-                         {label}
-                     </wa-button>
-                     '''
+                webview = _get_webview()
+
+                # Open Save Dialog
+                ext = file_name.split('.')[-1] if '.' in file_name else "*"
+                file_types = (f"{ext.upper()} File (*.{ext})", "All files (*.*)")
+                save_location = webview.windows[0].create_file_dialog(
+                    webview.SAVE_DIALOG, 
+                    save_filename=file_name,
+                    file_types=file_types
+                )
+
+                if save_location:
+                    if isinstance(save_location, list): save_location = save_location[0]
+                    if data_path is not None:
+                        shutil.copyfile(data_path, save_location)
+                    else:
+                        with open(save_location, "wb") as f:
+                            f.write(data_bytes)
+
+                    # Toast is not easily accessible here without app reference or a way to push JS
+                    # But we can try pushing a toast if we are in a callback
+                    # For now, just print to console or rely on OS feedback (file created)
+                    print(f"[Native] Saved to {save_location}")
+
+                    # Try to trigger a success toast via eval if possible
+                    get_session_store()['toasts'].append({"message": f"Saved to {os.path.basename(save_location)}", "variant": "success", "icon": "circle-check"})
+
+            except Exception as e:
+                print(f"[Native] Save failed: {e}")
+                return
+
+            # This action replaces on_click in Native Mode, so run it here
+            if on_click:
+                on_click()
+
+        # Native Mode markup: lite posts via htmx, ws sends over the socket.
+        # Memoized per mode: app.run() may still switch the mode after declaration.
+        native_html_by_mode = {}
+
+        static_href = {}
+
+        def builder():
+            # Native Mode (pywebview) is checked at render time rather than at
+            # declaration: top-level widgets are declared before the window exists.
+            if _is_native():
+                # Override global action for this component to be the save dialog
+                actions = get_session_store()['actions']
+                if actions.get(cid) is not native_save_action:
+                    actions[cid] = native_save_action
+                html = native_html_by_mode.get(self.mode)
+                if html is None:
+                    html = native_html_by_mode[self.mode] = _DOWNLOAD_BUTTON_NATIVE_TMPL.format(
+                        attrs=self._click_attrs(cid)[1],
+                        label=label_html,
+                    )
             else:
-                 # Web Mode: JS Download
-                download_script = f"""
-                <script>
-                window.download_{cid} = function() {{
-                    const link = document.createElement('a');
-                    link.href = '{data_url}';
-                    link.download = '{file_name}';
-                    document.body.appendChild(link);
-                    link.click();
-                    document.body.removeChild(link);
-                }};
-                </script>
-                """
-                
-                html = f'''
-                {download_script}
-                <wa-button variant="brand" appearance="accent" onclick="download_{cid}()">
-                    <wa-icon slot="start" name="download"></wa-icon>
-                    {label}
-                </wa-button>
-                '''
-            _wd = self._get_widget_defaults("download_button")
-            _fc = merge_cls(_wd.get("cls", ""), cls)
-            _fs = merge_style("display:flex; justify-content:center;", _wd.get("style", ""), style)
+                # Web Mode: the raw bytes are served by /__violit_download and
+                # the shared runtime helper reads the data attributes
+                if session_ctx.get() is None:
+                    # Session-less renders embed a data URL; build it once per button
+                    if "href" not in static_href:
+                        static_href["href"] = _download_public_url(self, cid, data_bytes, data_path, file_name, mime)
+                    href = static_href["href"]
+                else:
+                    href = _download_public_url(self, cid, data_bytes, data_path, file_name, mime,
+                                                owned=spool_owned)
+                html = _DOWNLOAD_BUTTON_WEB_TMPL.format(
+                    href=_attr(href),
+                    file_name=_attr(file_name),
+                    label=label_html,
+                )
+            _fc, _fs = self._resolved_cls_style("download_button", cls, style, _CENTER_FLEX_STYLE)
             return Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
         
         self._register_component(cid, builder, action=on_click)
@@ -271,23 +501,30 @@ class FormWidgetsMixin:
             icon: Icon name or emoji
         """
         cid = self._resolve_widget_cid("link_btn", key)
+        label_html = _text(label)
+
+        icon_html, icon_emoji = _button_icon_parts(icon)
+        if not icon:
+            icon_html = '<wa-icon slot="start" name="arrow-up-right-from-square"></wa-icon>'
+        html = _LINK_BUTTON_TMPL.format(
+            url=_attr(url),
+            flags=_button_flag_attrs(disabled, use_container_width),
+            icon_html=icon_html,
+            icon_emoji=icon_emoji,
+            label=label_html,
+        )
+
+        # The markup is fixed per call, so the Component is rebuilt only when
+        # the resolved widget defaults change.
+        built = {}
 
         def builder():
-            icon_html = f'<wa-icon slot="start" name="{icon}"></wa-icon>' if icon and not any(ord(c) > 127 for c in str(icon)) else ''
-            icon_emoji = f'{icon} ' if icon and any(ord(c) > 127 for c in str(icon)) else ''
-            if not icon:
-                icon_html = '<wa-icon slot="start" name="arrow-up-right-from-square"></wa-icon>'
-            disabled_attr = 'disabled' if disabled else ''
-            width_attr = 'style="width:100%;"' if use_container_width else ''
-            html = f'''
-            <wa-button variant="brand" appearance="accent" href="{url}" target="_blank" with-start {disabled_attr} {width_attr}>
-                {icon_html}{icon_emoji}{label}
-            </wa-button>
-            '''
-            _wd = self._get_widget_defaults("link_button")
-            _fc = merge_cls(_wd.get("cls", ""), cls)
-            _fs = merge_style("display:flex; justify-content:center;", _wd.get("style", ""), style)
-            return Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            resolved = self._resolved_cls_style("link_button", cls, style, _CENTER_FLEX_STYLE)
+            if built.get("key") != resolved:
+                _fc, _fs = resolved
+                built["key"] = resolved
+                built["component"] = Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            return built["component"]
 
         self._register_component(cid, builder)
 
@@ -298,20 +535,26 @@ class FormWidgetsMixin:
             disabled: If True, link is grayed out and not clickable
         """
         cid = self._resolve_widget_cid("page_link", key)
+        label_html = _text(label)
+
+        html = _PAGE_LINK_TMPL.format(
+            page=_attr(page),
+            link_style=_PAGE_LINK_DISABLED_STYLE if disabled else _PAGE_LINK_STYLE,
+            icon_html=f'<wa-icon name="{_attr(icon)}"></wa-icon>' if icon else "",
+            label=label_html,
+        )
         
+        # The markup is fixed per call, so the Component is rebuilt only when
+        # the resolved widget defaults change.
+        built = {}
+
         def builder():
-            icon_html = f'<wa-icon name="{icon}"></wa-icon>' if icon else ""
-            disabled_style = "pointer-events:none;opacity:0.5;" if disabled else ""
-            html = f'''
-            <a href="{page}" style="display:inline-flex;align-items:center;gap:0.5rem;color:var(--vl-primary);text-decoration:none;padding:0.5rem 1rem;border-radius:0.25rem;transition:background 0.2s;{disabled_style}">
-                {icon_html}
-                {label}
-            </a>
-            '''
-            _wd = self._get_widget_defaults("page_link")
-            _fc = merge_cls(_wd.get("cls", ""), cls)
-            _fs = merge_style(_wd.get("style", ""), style)
-            return Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            resolved = self._resolved_cls_style("page_link", cls, style)
+            if built.get("key") != resolved:
+                _fc, _fs = resolved
+                built["key"] = resolved
+                built["component"] = Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            return built["component"]
         
         self._register_component(cid, builder)
 
@@ -389,7 +632,9 @@ class FormWidgetsMixin:
                 "url": final_url,
             }
 
-        if self.mode == 'ws':
+        # ws mode and lite-mode actions both flush the client command queue,
+        # so only an initial lite render needs the one-shot script component.
+        if self.mode == 'ws' or action_ctx.get(False):
             self._enqueue_client_command('navigate', command_payload)
         else:
             cid = self._get_next_cid("page_switch")
@@ -417,6 +662,10 @@ class FormWidgetsMixin:
                 self.enter_to_submit = enter_to_submit
                 self.submitted = False
                 self.form_data = {}
+                # Bind the widgets typically used inside a form directly so
+                # those calls skip the __getattr__ fallback.
+                for name in _FORM_DELEGATED_METHODS:
+                    setattr(self, name, getattr(app, name))
                 
             def __enter__(self):
                 self.token = fragment_ctx.set(self.form_id)
@@ -425,39 +674,38 @@ class FormWidgetsMixin:
             def __exit__(self, exc_type, exc_val, exc_tb):
                 fragment_ctx.reset(self.token)
                 
+                border_style = "border:1px solid var(--vl-border);" if self.border else ""
+                if self.enter_to_submit:
+                    # Trigger the submit button's onclick (WebSocket action) on Enter,
+                    # but skip textareas where Enter should insert a newline.
+                    enter_handler = (
+                        'onkeydown="if(event.key===\'Enter\'&&!event.shiftKey'
+                        '&&event.target.tagName!==\'TEXTAREA\'){'
+                        'event.preventDefault();'
+                        'var btn=this.querySelector(\'wa-button[type=submit]\');'
+                        'if(btn)btn.click();}"'
+                    )
+                else:
+                    enter_handler = 'onkeydown="if(event.key===\'Enter\')event.preventDefault()"'
+                form_open = (
+                    f'<form id="{self.form_id}_element" {enter_handler} onsubmit="return false;" '
+                    f'style="display:flex;flex-direction:column;gap:var(--vl-widget-compound-gap, 1rem);'
+                    f'padding:1rem;{border_style}border-radius:0.5rem;background:var(--vl-bg-card);">'
+                )
+
                 # Register form builder
                 def builder():
                     store = get_session_store()
-                    
-                    # Render form components
-                    htmls = []
-                    # Check static
-                    for cid, b in self.app.static_fragment_components.get(self.form_id, []):
-                        htmls.append(b().render())
-                    # Check session
-                    for cid, b in store['fragment_components'].get(self.form_id, []):
-                        htmls.append(b().render())
-                    
-                    inner_html = "".join(htmls)
-                    border_style = "border:1px solid var(--vl-border);" if self.border else ""
-                    if self.enter_to_submit:
-                        # Trigger the submit button's onclick (WebSocket action) on Enter,
-                        # but skip textareas where Enter should insert a newline.
-                        enter_handler = (
-                            'onkeydown="if(event.key===\'Enter\'&&!event.shiftKey'
-                            '&&event.target.tagName!==\'TEXTAREA\'){'
-                            'event.preventDefault();'
-                            'var btn=this.querySelector(\'wa-button[type=submit]\');'
-                            'if(btn)btn.click();}"'
-                        )
-                    else:
-                        enter_handler = 'onkeydown="if(event.key===\'Enter\')event.preventDefault()"'
-                    html = f'''
-                    <form id="{self.form_id}_element" {enter_handler} onsubmit="return false;" style="display:flex;flex-direction:column;gap:var(--vl-widget-compound-gap, 1rem);padding:1rem;{border_style}border-radius:0.5rem;background:var(--vl-bg-card);">
-                        {inner_html}
-                    </form>
-                    '''
-                    return Component("div", id=self.form_id, content=html)
+                    static = self.app.static_fragment_components.get(self.form_id, ())
+                    session = store['fragment_components'].get(self.form_id, ())
+                    if not static and not session:
+                        return Component("div", id=self.form_id, content="")
+
+                    # Render form components (static first, then session).
+                    # str.join() materializes its argument anyway, so handing it
+                    # a list skips the generator's per-item resume overhead.
+                    inner_html = "".join([b().render() for _, b in itertools.chain(static, session)])
+                    return Component("div", id=self.form_id, content=f"{form_open}{inner_html}</form>")
                 
                 self.app._register_component(self.form_id, builder)
             
@@ -478,35 +726,36 @@ class FormWidgetsMixin:
             icon: Icon name or emoji
         """
         cid = self._resolve_widget_cid("form_submit", key)
+        label_html = _text(label)
         
         def action():
-            # Collect form data and call on_click
+            # Field values are already synced into their own states by the
+            # field widgets; the submit action only has to run on_click. It is
+            # always registered so a submit still triggers a dirty re-render.
             if on_click:
                 on_click()
         
+        icon_html, icon_emoji = _button_icon_parts(icon)
+        if not icon:
+            icon_html = '<wa-icon slot="start" name="circle-check"></wa-icon>'
+        variant, appearance = self._wa_button_theme(type)
+        flags = _button_flag_attrs(disabled, use_container_width)
+        # click_attrs() depends on the engine mode, which app.run() may still
+        # switch after declaration, so the markup is memoized per mode
+        html_by_mode = {}
+
         def builder():
-            attrs = self.engine.click_attrs(cid)
-            attrs_str = " ".join(f'{k}="{v}"' for k, v in attrs.items())
-            _variant = "default" if type == "secondary" else "primary"
-            icon_html = ''
-            if icon and not any(ord(c) > 127 for c in str(icon)):
-                icon_html = f'<wa-icon slot="start" name="{icon}"></wa-icon>'
-            elif icon:
-                icon_html = f'{icon} '
-            else:
-                icon_html = '<wa-icon slot="start" name="circle-check"></wa-icon>'
-            disabled_attr = 'disabled' if disabled else ''
-            width_attr = 'style="width:100%;"' if use_container_width else ''
-            variant, appearance = self._wa_button_theme(type)
-            html = f'''
-            <wa-button type="submit" variant="{variant}" appearance="{appearance}" with-start {disabled_attr} {width_attr} {attrs_str}>
-                {icon_html}
-                {label}
-            </wa-button>
-            '''
-            _wd = self._get_widget_defaults("form_submit_button")
-            _fc = merge_cls(_wd.get("cls", ""), cls)
-            _fs = merge_style("display:flex; justify-content:center;", _wd.get("style", ""), style)
+            html = html_by_mode.get(self.mode)
+            if html is None:
+                html = html_by_mode[self.mode] = _FORM_SUBMIT_TMPL.format(
+                    variant=variant,
+                    appearance=appearance,
+                    flags=flags,
+                    attrs=self._click_attrs(cid)[1],
+                    icon_html=icon_html or icon_emoji,
+                    label=label_html,
+                )
+            _fc, _fs = self._resolved_cls_style("form_submit_button", cls, style, _CENTER_FLEX_STYLE)
             return Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
         
         self._register_component(cid, builder, action=action)
@@ -522,30 +771,18 @@ class FormWidgetsMixin:
         Returns:
             bool: True if successful, False otherwise
         """
-        import os
-        
         try:
-            # Convert data to bytes if needed
-            if isinstance(data, str):
-                data_bytes = data.encode('utf-8')
-            elif isinstance(data, bytes):
-                data_bytes = data
-            elif hasattr(data, 'read'):
-                # File-like object
-                data_bytes = data.read()
-                if isinstance(data_bytes, str):
-                    data_bytes = data_bytes.encode('utf-8')
-            else:
-                data_bytes = str(data).encode('utf-8')
-            
             # Create directory if needed
             directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
             
-            # Write file
-            with open(file_path, 'wb') as f:
-                f.write(data_bytes)
+            # Write file (file-like objects are streamed in chunks)
+            if hasattr(data, 'read'):
+                with open(file_path, 'wb') as f:
+                    _copy_stream(data, f)
+            else:
+                _write_file_bytes(file_path, _to_bytes(data))
             
             # Show toast if message provided
             if toast_message:
@@ -569,33 +806,20 @@ class FormWidgetsMixin:
         This is a helper that works in button callbacks.
         For declarative UI, use download_button() instead.
         """
-        import os
-        
-        # Convert data to bytes
-        if isinstance(data, str):
-            data_bytes = data.encode('utf-8')
-        elif isinstance(data, bytes):
-            data_bytes = data
-        elif hasattr(data, 'read'):
-            data_bytes = data.read()
-            if isinstance(data_bytes, str):
-                data_bytes = data_bytes.encode('utf-8')
+        # Convert data to bytes. For file-like objects only the head is read
+        # up front; anything past the data-URL limit stays in `stream`.
+        stream = None
+        if hasattr(data, 'read'):
+            data_bytes = _to_bytes(data.read(_DATA_URL_MAX_BYTES + 1))
+            if len(data_bytes) > _DATA_URL_MAX_BYTES:
+                stream = data
         else:
-            data_bytes = str(data).encode('utf-8')
+            data_bytes = _to_bytes(data)
         
-        # Check if running in Native mode
-        is_native = False
-        try:
-            import webview
-            if len(webview.windows) > 0:
-                is_native = True
-        except ImportError:
-            pass
-        
-        if is_native:
+        if _is_native():
             # Native Mode: File save dialog
             try:
-                import webview
+                webview = _get_webview()
                 ext = file_name.split('.')[-1] if '.' in file_name else "*"
                 file_types = (f"{ext.upper()} File (*.{ext})", "All files (*.*)")
                 
@@ -611,6 +835,8 @@ class FormWidgetsMixin:
                     
                     with open(save_location, "wb") as f:
                         f.write(data_bytes)
+                        if stream is not None:
+                            _copy_stream(stream, f)
                     
                     msg = toast_message or f"Saved to {os.path.basename(save_location)}"
                     self.toast(msg, variant="success")
@@ -618,14 +844,24 @@ class FormWidgetsMixin:
             except Exception as e:
                 self.toast(f"Save failed: {str(e)}", variant="danger")
         else:
-            # Web Mode: JavaScript download
-            import base64
-            data_b64 = base64.b64encode(data_bytes).decode('utf-8')
-            data_url = f"data:{mime};base64,{data_b64}"
+            # Web Mode: JavaScript download. The raw payload is served by
+            # /__violit_download when the browser follows the link, so nothing
+            # is base64-encoded up front; large payloads are spooled to disk.
+            data_path = None
+            if len(data_bytes) > _DATA_URL_MAX_BYTES:
+                data_path = _spool_to_temp(data_bytes, stream, file_name)
+                data_bytes = None
+            elif len(data_bytes) > _DATA_URL_WARN_BYTES and session_ctx.get() is None:
+                logger.warning(
+                    "[violit] download_file(%r) sends %d bytes as a base64 data URL; "
+                    "consider save_file() for large payloads.",
+                    file_name, len(data_bytes),
+                )
+            href = _download_public_url(self, uuid.uuid4().hex, data_bytes, data_path, file_name, mime, once=True, owned=True)
             self._enqueue_client_command(
                 'download.start',
                 {
-                    'href': data_url,
+                    'href': href,
                     'fileName': str(file_name),
                 },
             )
@@ -1,32 +1,108 @@
 """Input widgets"""
 
 from typing import Union, Callable, Optional, List, Any
-import base64
+import binascii
+import datetime
 import hashlib
 import html as html_lib
 import io
 import json
+import os
 import re
-from ..component import Component, normalize_public_component_props, serialize_public_component_attrs
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from ..component import Component, RawHTML, normalize_public_component_props, serialize_public_component_attrs
 from ..context import rendering_ctx, layout_ctx
 from ..state import State
 from ..style_utils import auto_split_widget_cls, merge_cls, merge_style, merge_part_cls, serialize_part_cls, wrap_html
 
+# pybase64 (SIMD base64 codec) is used when installed; stdlib base64 otherwise
+try:
+    import pybase64 as _pybase64
+except ImportError:
+    _pybase64 = None
+
+
+def _b64decode(data) -> bytes:
+    if _pybase64 is not None:
+        return _pybase64.b64decode(data, validate=False)
+    # Call the C decoder directly; base64.b64decode only adds argument
+    # normalization on top of it (non-strict mode is the default).
+    return binascii.a2b_base64(data)
+
+
+# Decodes the files of a multi-file upload in parallel (created on first use)
+_decode_pool: Optional[ThreadPoolExecutor] = None
+_decode_pool_lock = threading.Lock()
+
+
+def _get_decode_pool() -> ThreadPoolExecutor:
+    global _decode_pool
+    with _decode_pool_lock:
+        if _decode_pool is None:
+            _decode_pool = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="violit-upload",
+            )
+        return _decode_pool
+
+
+def _uploaded_file_from_payload(f_data: dict) -> "UploadedFile":
+    if "data" in f_data:
+        # Raw bytes streamed over binary WebSocket frames (no base64)
+        return UploadedFile(f_data.get("name"), f_data.get("type"), f_data.get("size"), "", data=f_data["data"])
+    return UploadedFile(f_data.get("name"), f_data.get("type"), f_data.get("size"), f_data.get("content"))
+
+
+def _parse_number(v) -> Union[int, float]:
+    """Parse a numeric action value: float if it has a decimal point, else int."""
+    if type(v) is int or type(v) is float:
+        return v
+    text = str(v)
+    return float(text) if '.' in text else int(text)
+
+
+def _split_csv(text: str) -> List[str]:
+    """Split a comma-separated action value, dropping blank items."""
+    return [item for item in map(str.strip, text.split(',')) if item]
+
+
+def _lite_input_attrs(cid: str) -> dict:
+    return {"hx-post": f"/action/{cid}", "hx-trigger": "input delay:50ms", "hx-swap": "none", "name": "value"}
+
+
+def _lite_change_attrs(cid: str) -> dict:
+    return {"hx-post": f"/action/{cid}", "hx-trigger": "change", "hx-swap": "none", "name": "value"}
+
+
+def _ws_change_attrs(cid: str) -> dict:
+    # Picked up by the runtime's delegated document-level change listener
+    return {"data-vl-change-action": cid}
+
+
+# Transport attrs for native change-driven inputs, keyed by app mode
+_CHANGE_ATTR_BUILDERS = {"lite": _lite_change_attrs, "ws": _ws_change_attrs}
+
 
 class UploadedFile(io.BytesIO):
-    def __init__(self, name, type, size, content_b64):
+    def __init__(self, name, type, size, content_b64, data: Optional[bytes] = None):
         self.name = name
         self.type = type
         self.size = size
+        if data is not None:
+            self.header = ""
+            super().__init__(data)
+            return
         # content_b64 is like "data:text/csv;base64,AAAA..."
-        if "," in content_b64:
-             self.header, data = content_b64.split(",", 1)
-        else:
-             self.header = ""
-             data = content_b64
+        comma = content_b64.find(",")
+        self.header = content_b64[:comma] if comma >= 0 else ""
         try:
-            decoded = base64.b64decode(data)
-        except:
+            # Encode once and decode through a memoryview slice, so the payload
+            # is not also copied by a str split and by b64decode's own encode.
+            # BytesIO shares the decoded bytes until the file is written to.
+            raw = content_b64.encode("utf-8")
+            decoded = _b64decode(memoryview(raw)[raw.find(b",") + 1:])
+        except binascii.Error:
             decoded = b""
         super().__init__(decoded)
     
@@ -233,6 +309,7 @@ class InputWidgetsMixin:
 
         cid = self._resolve_widget_cid("select_slider", key)
         safe_props = self._normalize_public_widget_props(dict(props))
+        props_str = self._serialize_widget_attrs(safe_props)
         default_val = value if value is not None else options[0]
         s = self._resolve_widget_state("select_slider", label, default_val, key=key, bind=bind)
         options_str = [str(o) for o in options]
@@ -262,29 +339,12 @@ class InputWidgetsMixin:
 
             if self.mode == 'lite':
                 attrs_str = f'hx-post="/action/{cid}" hx-trigger="change" hx-swap="none" hx-vals="js:{{value: event.target.value}}"'
-                listener_script = ""
             else:
-                attrs_str = ""
-                listener_script = f'''
-                <script>
-                (function() {{
-                    var el = document.getElementById('{range_id}');
-                    var display = document.getElementById('{cid}_display');
-                    var opts = {json.dumps(options_str)};
-                    if (el && !el.hasAttribute('data-ws-listener')) {{
-                        el.setAttribute('data-ws-listener', 'true');
-                        el.addEventListener('input', function() {{
-                            if (display) display.textContent = opts[parseInt(el.value)];
-                        }});
-                        el.addEventListener('change', function() {{
-                            window.sendAction('{cid}', el.value);
-                        }});
-                    }}
-                }})();
-                </script>
-                '''
-
-            props_str = self._serialize_widget_attrs(safe_props)
+                attrs_str = self._runtime_attr_string(
+                    ["select-slider"],
+                    {"data-vl-select-slider-config": {"cid": cid, "options": options_str}},
+                )
+
 
             # 5. Position labels precisely using relative/absolute positioning
             # A standard Web Awesome slider thumb is typically 15px-16px.
@@ -314,7 +374,6 @@ class InputWidgetsMixin:
                     {ticks}
                 </div>
                 <div id="{cid}_display" style="text-align:center; font-weight:600; margin-top:0.25rem; font-size:0.875rem;">{current_label}</div>
-            {listener_script}
             '''
             _wd = self._get_widget_defaults("select_slider")
             _fc = merge_cls(_wd.get("cls", ""), cls)
@@ -340,6 +399,7 @@ class InputWidgetsMixin:
         cid = self._resolve_widget_cid("checkbox", key)
         user_part_cls = props.pop("part_cls", None)
         safe_props = self._normalize_public_widget_props(dict(props))
+        props_str = self._serialize_widget_attrs(safe_props)
         
         s = self._resolve_widget_state("checkbox", label, value, key=key, bind=bind)
         
@@ -348,46 +408,57 @@ class InputWidgetsMixin:
             s.set(real_val)
             if on_change: on_change(real_val)
         
+        # The markup only varies with the checked state and the widget
+        # defaults, so each variant is built once until configure_widget runs.
+        built = {}
+
         def builder():
             # Subscribe to own state - client-side will handle smart updates
             token = rendering_ctx.set(cid)
-            cv = s.value
+            checked = bool(s.value)
             rendering_ctx.reset(token)
-            
-            checked_attr = 'checked' if cv else ''
-            props_str = self._serialize_widget_attrs(safe_props)
-            runtime_init_names = ["input-control"]
-            runtime_config = {
-                "cid": cid,
-                "eventName": "change",
-                "transport": "lite-direct" if self.mode == 'lite' else "ws",
-                "valueProp": "checked",
-                "desiredValue": bool(cv),
-            }
-            
-            if self.mode == 'lite':
-                attrs_str = ""
-            else:
-                attrs_str = ""
-            
-            disabled_attr = 'disabled' if disabled else ''
-            help_html = f'<br><span style="font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</span>' if help else ''
-            _wd = self._get_widget_defaults("checkbox")
-            default_host_cls, default_auto_part_cls = auto_split_widget_cls("checkbox", _wd.get("cls", ""))
-            user_host_cls, user_auto_part_cls = auto_split_widget_cls("checkbox", cls)
-            _fc = merge_cls(default_host_cls, user_host_cls)
-            _fs = merge_style(_wd.get("style", ""), style)
-            _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
-            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"' if _part_cls else ''
-            if _part_cls:
-                runtime_init_names.append("part-bridge")
-                runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            html = f'<wa-checkbox id="{cid}"{part_attr} {runtime_attrs} {checked_attr} {disabled_attr} {attrs_str} {props_str}>{html_lib.escape(str(label))}{help_html}</wa-checkbox>'
-            return Component(None, id=cid, content=wrap_html(html, _fc, _fs))
+
+            defaults = self._widget_defaults.get("checkbox")
+            if built.get("defaults", built) is not defaults:
+                built.clear()
+                built["defaults"] = defaults
+            html = built.get(checked)
+            if html is None:
+                html = built[checked] = self._checked_control_html(
+                    "checkbox", "wa-checkbox", cid, checked, label, disabled, help,
+                    cls, style, user_part_cls, props_str,
+                )
+            return RawHTML(cid, html)
         self._register_component(cid, builder, action=action)
         return s
 
+    def _checked_control_html(self, widget_type, tag_name, cid, checked, label, disabled, help,
+                              cls, style, user_part_cls, props_str):
+        """Render the wrapped markup of a checkbox-like control for one checked state."""
+        runtime_init_names = ["input-control"]
+        runtime_config = {
+            "cid": cid,
+            "eventName": "change",
+            "transport": "lite-direct" if self.mode == 'lite' else "ws",
+            "valueProp": "checked",
+            "desiredValue": checked,
+        }
+        checked_attr = 'checked' if checked else ''
+        disabled_attr = 'disabled' if disabled else ''
+        help_html = f'<br><span style="font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</span>' if help else ''
+        _wd = self._get_widget_defaults(widget_type)
+        default_host_cls, default_auto_part_cls = auto_split_widget_cls(widget_type, _wd.get("cls", ""))
+        user_host_cls, user_auto_part_cls = auto_split_widget_cls(widget_type, cls)
+        _fc = merge_cls(default_host_cls, user_host_cls)
+        _fs = merge_style(_wd.get("style", ""), style)
+        _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
+        part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"' if _part_cls else ''
+        if _part_cls:
+            runtime_init_names.append("part-bridge")
+        runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
+        html = f'<{tag_name} id="{cid}"{part_attr} {runtime_attrs} {checked_attr} {disabled_attr}  {props_str}>{html_lib.escape(str(label))}{help_html}</{tag_name}>'
+        return wrap_html(html, _fc, _fs)
+
     def radio(self, label, options, index=0, key=None, on_change=None,
               horizontal=False, captions=None,
               disabled=False, label_visibility="visible", help=None,
@@ -404,6 +475,7 @@ class InputWidgetsMixin:
         cid = self._resolve_widget_cid("radio_group", key)
         user_part_cls = props.pop("part_cls", None)
         safe_props = self._normalize_public_widget_props(dict(props))
+        props_str = self._serialize_widget_attrs(safe_props)
         
         default_val = options[index] if options else None
         s = self._resolve_widget_state("radio", label, default_val, key=key, bind=bind)
@@ -411,7 +483,31 @@ class InputWidgetsMixin:
         def action(v):
             s.set(v)
             if on_change: on_change(v)
-            
+
+        # Option markup is fixed per call apart from the part attr, which comes
+        # from the widget defaults; rendered variants are kept per part attr.
+        radio_options = []
+        for i_opt, opt in enumerate(options):
+            escaped_opt = html_lib.escape(str(opt), quote=True)
+            caption_html = ''
+            option_style = 'display:block;margin:0;'
+            if captions and i_opt < len(captions) and captions[i_opt]:
+                caption_html = f'<br><span style="font-size:0.75rem;color:var(--vl-text-muted);font-weight:normal;">{html_lib.escape(str(captions[i_opt]))}</span>'
+                if horizontal:
+                    option_style = 'display:inline-flex;align-items:flex-start;vertical-align:middle;margin:0;'
+            elif horizontal:
+                option_style = 'display:inline-flex;align-items:center;vertical-align:middle;margin:0;'
+            radio_options.append((opt, f'<wa-radio value="{escaped_opt}" style="{option_style}"', f'>{escaped_opt}{caption_html}</wa-radio>'))
+        disabled_attr = 'disabled' if disabled else ''
+        help_attr = f'hint="{html_lib.escape(str(help), quote=True)}"' if help else ''
+        escaped_label = html_lib.escape(str(label), quote=True)
+        # Keep the default layout vertical and only opt into horizontal rows when requested.
+        options_layout_style = 'display:flex;flex-direction:column;gap:0.5rem;'
+        if horizontal:
+            options_layout_style = 'display:flex;flex-direction:row;flex-wrap:wrap;gap:1rem;align-items:center;'
+
+        rendered_options = {}
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
@@ -435,37 +531,22 @@ class InputWidgetsMixin:
             if _part_cls:
                 runtime_init_names.append("part-bridge")
             
-            opts_html = ""
-            for i_opt, opt in enumerate(options):
-                sel = 'checked' if opt == cv else ''
-                escaped_opt = html_lib.escape(str(opt), quote=True)
-                caption_html = ''
-                option_style = 'display:block;margin:0;'
-                if captions and i_opt < len(captions) and captions[i_opt]:
-                    caption_html = f'<br><span style="font-size:0.75rem;color:var(--vl-text-muted);font-weight:normal;">{html_lib.escape(str(captions[i_opt]))}</span>'
-                    if horizontal:
-                        option_style = 'display:inline-flex;align-items:flex-start;vertical-align:middle;margin:0;'
-                elif horizontal:
-                    option_style = 'display:inline-flex;align-items:center;vertical-align:middle;margin:0;'
-                opts_html += f'<wa-radio value="{escaped_opt}" style="{option_style}"{radio_part_attr} {sel}>{escaped_opt}{caption_html}</wa-radio>'
-            
-            if self.mode == 'lite':
-                attrs_str = ""
-            else:
-                attrs_str = ""
-            
-            props_str = self._serialize_widget_attrs(safe_props)
+            variants = rendered_options.get(radio_part_attr)
+            if variants is None:
+                rendered_options.clear()
+                variants = rendered_options[radio_part_attr] = [
+                    (opt, f'{head}{radio_part_attr} {tail}', f'{head}{radio_part_attr} checked{tail}')
+                    for opt, head, tail in radio_options
+                ]
+            opts_html = "".join([
+                checked if opt == cv else plain
+                for opt, plain, checked in variants
+            ])
+
             escaped_cv = html_lib.escape(str(cv), quote=True)
-            disabled_attr = 'disabled' if disabled else ''
-            help_attr = f'hint="{html_lib.escape(str(help), quote=True)}"' if help else ''
-            escaped_label = html_lib.escape(str(label), quote=True)
             runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            # Keep the default layout vertical and only opt into horizontal rows when requested.
-            options_layout_style = 'display:flex;flex-direction:column;gap:0.5rem;'
-            if horizontal:
-                options_layout_style = 'display:flex;flex-direction:row;flex-wrap:wrap;gap:1rem;align-items:center;'
-            html = f'<wa-radio-group id="{cid}" label="{escaped_label}" value="{escaped_cv}" {runtime_attrs} {disabled_attr} {help_attr} {attrs_str} {props_str}><div style="{options_layout_style}">{opts_html}</div></wa-radio-group>'
-            return Component(None, id=cid, content=wrap_html(html, _fc, _fs))
+            html = f'<wa-radio-group id="{cid}" label="{escaped_label}" value="{escaped_cv}" {runtime_attrs} {disabled_attr} {help_attr}  {props_str}><div style="{options_layout_style}">{opts_html}</div></wa-radio-group>'
+            return RawHTML(cid, wrap_html(html, _fc, _fs))
             
         self._register_component(cid, builder, action=action)
         return s
@@ -491,6 +572,16 @@ class InputWidgetsMixin:
         s = s.replace('%25', '%')
         return s
 
+    @staticmethod
+    def _select_option_parts(options):
+        """Pre-render each option as (value, unselected markup, selected markup)."""
+        parts = []
+        for opt in options:
+            head = f'<wa-option value="{html_lib.escape(InputWidgetsMixin._select_encode(opt), quote=True)}" '
+            tail = f'>{html_lib.escape(str(opt), quote=True)}</wa-option>'
+            parts.append((opt, head + tail, head + "selected" + tail))
+        return parts
+
     def selectbox(self, label, options, index=0, key=None, on_change=None,
                    placeholder=None, disabled=False,
                    label_visibility="visible", label_position="top", help=None,
@@ -517,27 +608,40 @@ class InputWidgetsMixin:
             s.set(decoded)
             if on_change: on_change(decoded)
             
+        select_options = InputWidgetsMixin._select_option_parts(options)
+
+        # Label and user attrs are fixed per call; escape and serialize them once.
+        internal_label_visibility = label_visibility if label_position == "top" else "collapsed"
+        rendered_label, label_attrs = self._select_label_visibility_attrs(label, internal_label_visibility)
+        if label_position != "top" and label:
+            label_attrs["aria-label"] = label
+        escaped_label = html_lib.escape(str(rendered_label), quote=True)
+        extra_attrs = {}
+        if placeholder: extra_attrs['placeholder'] = placeholder
+        if disabled: extra_attrs['disabled'] = True
+        if help: extra_attrs['hint'] = help
+        serialized_attrs = self._serialize_widget_attrs({**label_attrs, **extra_attrs, **safe_props}, allow_event_handlers=True)
+        attrs_suffix = f' {serialized_attrs}' if serialized_attrs else ''
+        external_label_html = ""
+        if label_position != "top" and label_visibility != "collapsed" and label:
+            label_cls = "vl-selectbox-external-label"
+            if label_visibility == "hidden":
+                label_cls += " vl-selectbox-external-label--hidden"
+            external_label_html = f'<div class="{label_cls}">{html_lib.escape(str(label))}</div>'
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
             runtime_init_names = ["input-control"]
             
-            opts_html = ""
-            for opt in options:
-                encoded_opt = InputWidgetsMixin._select_encode(opt)
-                escaped_encoded = html_lib.escape(encoded_opt, quote=True)
-                escaped_display = html_lib.escape(str(opt), quote=True)
-                sel = 'selected' if opt == cv else ''
-                opts_html += f'<wa-option value="{escaped_encoded}" {sel}>{escaped_display}</wa-option>'
+            opts_html = "".join([
+                selected if opt == cv else plain
+                for opt, plain, selected in select_options
+            ])
             
             encoded_cv = InputWidgetsMixin._select_encode(cv) if cv is not None else ''
             escaped_cv = html_lib.escape(encoded_cv, quote=True)
-            internal_label_visibility = label_visibility if label_position == "top" else "collapsed"
-            rendered_label, label_attrs = self._select_label_visibility_attrs(label, internal_label_visibility)
-            if label_position != "top" and label:
-                label_attrs["aria-label"] = label
-            escaped_label = html_lib.escape(str(rendered_label), quote=True)
             runtime_config = {
                 "cid": cid,
                 "eventName": "change",
@@ -546,52 +650,27 @@ class InputWidgetsMixin:
                 "desiredValue": encoded_cv,
             }
             
-            if self.mode == 'lite':
-                attrs = {}
-            else:
-                attrs = {}
-            
-            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            select_html = f'<wa-select id="{cid}" label="{escaped_label}" value="{escaped_cv}" appearance="outlined" {runtime_attrs}'
-            extra_attrs = {}
-            if placeholder: extra_attrs['placeholder'] = placeholder
-            if disabled: extra_attrs['disabled'] = True
-            if help: extra_attrs['hint'] = help
-            merged_attrs = {**attrs, **label_attrs, **extra_attrs, **safe_props}
-            serialized_attrs = self._serialize_widget_attrs(merged_attrs, allow_event_handlers=True)
-            if serialized_attrs:
-                select_html += f' {serialized_attrs}'
-            select_html += f'>{opts_html}</wa-select>'
-            
             _wd = self._get_widget_defaults("selectbox")
             default_host_cls, default_auto_part_cls = auto_split_widget_cls("selectbox", _wd.get("cls", ""))
             user_host_cls, user_auto_part_cls = auto_split_widget_cls("selectbox", cls)
             _fc = merge_cls(default_host_cls, user_host_cls)
             _fs = merge_style(_wd.get("style", ""), style)
             _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
+            part_attr = ''
             if _part_cls:
                 runtime_init_names.append("part-bridge")
-                runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
                 part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"'
-                select_html = select_html.replace(f'<wa-select id="{cid}"', f'<wa-select id="{cid}"{part_attr}', 1)
-                select_html = select_html.replace(' appearance="outlined" ', f' appearance="outlined" {runtime_attrs} ', 1)
-            content_html = select_html
+            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
+            content_html = f'<wa-select id="{cid}"{part_attr} label="{escaped_label}" value="{escaped_cv}" appearance="outlined" {runtime_attrs}{attrs_suffix}>{opts_html}</wa-select>'
             if label_position != "top":
-                label_html = ""
-                if label_visibility != "collapsed" and label:
-                    escaped_external_label = html_lib.escape(str(label))
-                    label_cls = "vl-selectbox-external-label"
-                    if label_visibility == "hidden":
-                        label_cls += " vl-selectbox-external-label--hidden"
-                    label_html = f'<div class="{label_cls}">{escaped_external_label}</div>'
                 control_html = f'<div class="vl-selectbox-control">{content_html}</div>'
                 if label_position == "right":
-                    content_html = f'<div class="vl-selectbox-layout vl-selectbox-layout--right">{control_html}{label_html}</div>'
+                    content_html = f'<div class="vl-selectbox-layout vl-selectbox-layout--right">{control_html}{external_label_html}</div>'
                 elif label_position == "bottom":
-                    content_html = f'<div class="vl-selectbox-layout vl-selectbox-layout--bottom">{control_html}{label_html}</div>'
+                    content_html = f'<div class="vl-selectbox-layout vl-selectbox-layout--bottom">{control_html}{external_label_html}</div>'
                 else:
-                    content_html = f'<div class="vl-selectbox-layout vl-selectbox-layout--left">{label_html}{control_html}</div>'
-            return Component(None, id=cid, content=wrap_html(content_html, _fc, _fs))
+                    content_html = f'<div class="vl-selectbox-layout vl-selectbox-layout--left">{external_label_html}{control_html}</div>'
+            return RawHTML(cid, wrap_html(content_html, _fc, _fs))
             
         self._register_component(cid, builder, action=action)
         return s
@@ -617,7 +696,7 @@ class InputWidgetsMixin:
         
         def action(v):
             if isinstance(v, str):
-                selected = [InputWidgetsMixin._select_decode(x.strip()) for x in v.split(',') if x.strip()]
+                selected = [InputWidgetsMixin._select_decode(x) for x in _split_csv(v)]
             elif isinstance(v, list):
                 selected = [InputWidgetsMixin._select_decode(x) for x in v]
             else:
@@ -625,18 +704,29 @@ class InputWidgetsMixin:
             s.set(selected)
             if on_change: on_change(selected)
         
+        select_options = InputWidgetsMixin._select_option_parts(options)
+        rendered_label, label_attrs = self._select_label_visibility_attrs(label, label_visibility)
+        static_extra = {}
+        if placeholder: static_extra['placeholder'] = placeholder
+        if disabled: static_extra['disabled'] = True
+        if help: static_extra['hint'] = help
+        if max_selections: static_extra['max-options-visible'] = max_selections
+        static_extra.update(label_attrs)
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
             runtime_init_names = ["input-control"]
-            opts_html = ""
-            for opt in options:
-                encoded_opt = InputWidgetsMixin._select_encode(opt)
-                escaped_encoded = html_lib.escape(encoded_opt, quote=True)
-                escaped_display = html_lib.escape(str(opt), quote=True)
-                sel = 'selected' if opt in cv else ''
-                opts_html += f'<wa-option value="{escaped_encoded}" {sel}>{escaped_display}</wa-option>'
+            try:
+                cv_lookup = cv if isinstance(cv, (set, frozenset)) else set(cv)
+            except TypeError:
+                # Unhashable option values fall back to a linear scan
+                cv_lookup = cv
+            opts_html = "".join([
+                selected if opt in cv_lookup else plain
+                for opt, plain, selected in select_options
+            ])
             
             encoded_cv = [InputWidgetsMixin._select_encode(x) for x in cv] if cv else []
             runtime_config = {
@@ -653,15 +743,9 @@ class InputWidgetsMixin:
             _fc = merge_cls(default_host_cls, user_host_cls)
             _fs = merge_style(_wd.get("style", ""), style)
             _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
-            rendered_label, label_attrs = self._select_label_visibility_attrs(label, label_visibility)
             # wa-select: cls/style applied via wrapper since this is a Web Awesome component
             # label escaping handled by Component.render(); opts_html is raw so manually escaped above
-            _ms_extra = {}
-            if placeholder: _ms_extra['placeholder'] = placeholder
-            if disabled: _ms_extra['disabled'] = True
-            if help: _ms_extra['hint'] = help
-            if max_selections: _ms_extra['max-options-visible'] = max_selections
-            _ms_extra.update(label_attrs)
+            _ms_extra = dict(static_extra)
             _ms_extra.update(self._runtime_init_props(runtime_init_names, {"data-vl-input-config": runtime_config}))
             if _part_cls:
                 runtime_init_names.append("part-bridge")
@@ -670,8 +754,8 @@ class InputWidgetsMixin:
             inner = Component("wa-select", id=cid, label=rendered_label, content=opts_html, multiple=True, with_clear=True, appearance="outlined", **_ms_extra)
             inner_html = inner.render()
             if _fc or _fs:
-                return Component(None, id=f"{cid}_wrap", content=wrap_html(inner_html, _fc, _fs))
-            return Component(None, id=cid, content=inner_html)
+                return RawHTML(f"{cid}_wrap", wrap_html(inner_html, _fc, _fs))
+            return RawHTML(cid, inner_html)
         
         self._register_component(cid, builder, action=action)
         
@@ -703,16 +787,29 @@ class InputWidgetsMixin:
         def action(v):
             s.set(v)
             if on_change: on_change(v)
+
+        static_textarea_props = {}
+        if max_chars is not None: static_textarea_props["maxlength"] = max_chars
+        if placeholder: static_textarea_props["placeholder"] = placeholder
+        if disabled: static_textarea_props["disabled"] = True
+        if help: static_textarea_props["hint"] = help
+        escaped_label = html_lib.escape(str(label), quote=True)
+        # rows/resize/style feed the sizing logic below; the rest pass through as attrs
+        builder_props = dict(local_props)
+        rows_value = builder_props.pop("rows", None)
+        resize_prop = builder_props.pop("resize", None)
+        existing_inner_style = builder_props.pop("style", "")
+        user_host_cls, user_auto_part_cls = auto_split_widget_cls("text_area", cls)
+        built = {}
         
         def builder():
-            # Create local shallow copies of cls/style to avoid shadowing/unbound errors
-            _cls = cls
-            _style = style
-            builder_props = dict(local_props)
-
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
+            # Skip the rebuild when neither the value nor the widget defaults changed
+            memo_key = (type(cv), cv, self.mode, self._widget_defaults.get("text_area"))
+            if built.get("key") == memo_key:
+                return built["component"]
 
             text_value = "" if cv is None else str(cv)
             content_lines = text_value.count("\n") + 1 if text_value else 1
@@ -721,14 +818,12 @@ class InputWidgetsMixin:
             explicit_height_px = None
             height_mode = None
 
-            rows_value = builder_props.pop("rows", None)
             if rows_value is not None:
                 try:
                     effective_rows = max(1, int(float(str(rows_value).strip().replace("rows", ""))))
                 except ValueError:
                     effective_rows = 3
 
-            resize_prop = builder_props.pop("resize", None)
             if height is None:
                 pass
             elif isinstance(height, (int, float)):
@@ -769,18 +864,13 @@ class InputWidgetsMixin:
                 "extraSync": "textarea-autoresize" if textarea_resize == "auto" else None,
             }
 
-            if self.mode == 'lite':
-                attrs = {"hx-post": f"/action/{cid}", "hx-trigger": "input delay:50ms", "hx-swap": "none", "name": "value"}
-            else:
-                attrs = {}
-            
+            attrs = _lite_input_attrs(cid) if self.mode == 'lite' else {}
             textarea_props = {"resize": textarea_resize, "rows": effective_rows}
 
             # Web Awesome's auto resize can still collapse empty textareas to a single line
             # before the component fully measures itself, especially in initially hidden tabs.
             # Give the host element a stable baseline size that follows Streamlit-style height semantics.
             min_height_rem = max(4.75, 1.35 * effective_rows + 1.2)
-            existing_inner_style = builder_props.pop("style", "")
             if explicit_height_px is not None:
                 textarea_style = merge_style(existing_inner_style, f"--wa-form-control-height: {explicit_height_px}px;")
             elif height_mode == "stretch":
@@ -788,34 +878,26 @@ class InputWidgetsMixin:
             else:
                 textarea_style = merge_style(existing_inner_style, f"min-height: {min_height_rem:.2f}rem;")
             textarea_props["style"] = textarea_style
+            textarea_props.update(static_textarea_props)
 
-            if max_chars is not None: textarea_props["maxlength"] = max_chars
-            if placeholder: textarea_props["placeholder"] = placeholder
-            if disabled: textarea_props["disabled"] = True
-            if help: textarea_props["hint"] = help
-            escaped_label = html_lib.escape(str(label), quote=True)
-            escaped_value = html_lib.escape(str(cv), quote=True)
-            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            html = f'<wa-textarea id="{cid}" label="{escaped_label}" value="{escaped_value}" appearance="outlined" {runtime_attrs}'
-            serialized_attrs = self._serialize_widget_attrs({**attrs, **textarea_props, **builder_props}, allow_event_handlers=True)
-            if serialized_attrs:
-                html += f' {serialized_attrs}'
-            html += f'></wa-textarea>'
-            
             _wd = self._get_widget_defaults("text_area")
             default_host_cls, default_auto_part_cls = auto_split_widget_cls("text_area", _wd.get("cls", ""))
-            user_host_cls, user_auto_part_cls = auto_split_widget_cls("text_area", _cls)
             _fc = merge_cls(default_host_cls, user_host_cls)
-            _fs = merge_style(_wd.get("style", ""), _style)
+            _fs = merge_style(_wd.get("style", ""), style)
             _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
-            part_bridge_script = ""
+            part_attr = ''
             if _part_cls:
                 runtime_init_names.append("part-bridge")
-                runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
                 part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"'
-                html = html.replace(f'<wa-textarea id="{cid}"', f'<wa-textarea id="{cid}"{part_attr}', 1)
-                html = html.replace(' appearance="outlined" ', f' appearance="outlined" {runtime_attrs} ', 1)
-            return Component(None, id=cid, content=wrap_html(html, _fc, _fs))
+
+            escaped_value = html_lib.escape(str(cv), quote=True)
+            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
+            serialized_attrs = self._serialize_widget_attrs({**attrs, **textarea_props, **builder_props}, allow_event_handlers=True)
+            attrs_suffix = f' {serialized_attrs}' if serialized_attrs else ''
+            html = f'<wa-textarea id="{cid}"{part_attr} label="{escaped_label}" value="{escaped_value}" appearance="outlined" {runtime_attrs}{attrs_suffix}></wa-textarea>'
+            component = RawHTML(cid, wrap_html(html, _fc, _fs))
+            built["key"], built["component"] = memo_key, component
+            return component
         
         self._register_component(cid, builder, action=action)
         return s
@@ -841,12 +923,24 @@ class InputWidgetsMixin:
         
         def action(v):
             try:
-                num_val = float(v) if '.' in str(v) else int(v)
+                num_val = _parse_number(v)
                 s.set(num_val)
                 if on_change: on_change(num_val)
             except (ValueError, TypeError):
                 pass
         
+        # Everything but the value and the widget defaults is fixed per call;
+        # the attrs only vary with the app mode.
+        num_props = {"type": "number"}
+        if min_value is not None: num_props["min"] = min_value
+        if max_value is not None: num_props["max"] = max_value
+        if step is not None: num_props["step"] = step
+        if placeholder: num_props["placeholder"] = placeholder
+        if disabled: num_props["disabled"] = True
+        if help: num_props["hint"] = help
+        escaped_label = html_lib.escape(str(label), quote=True)
+        serialized_by_mode = {}
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
@@ -859,42 +953,27 @@ class InputWidgetsMixin:
                 "valueProp": "value",
                 "desiredValue": "" if cv is None else str(cv),
             }
-            
-            if self.mode == 'lite':
-                attrs = {"hx-post": f"/action/{cid}", "hx-trigger": "input delay:50ms", "hx-swap": "none", "name": "value"}
-            else:
-                attrs = {}
-            
-            num_props = {"type": "number"}
-            if min_value is not None: num_props["min"] = min_value
-            if max_value is not None: num_props["max"] = max_value
-            if step is not None: num_props["step"] = step
-            if placeholder: num_props["placeholder"] = placeholder
-            if disabled: num_props["disabled"] = True
-            if help: num_props["hint"] = help
-            
-            escaped_label = html_lib.escape(str(label), quote=True)
-            escaped_value = html_lib.escape(str(cv), quote=True)
-            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            html = f'<wa-input id="{cid}" label="{escaped_label}" value="{escaped_value}" appearance="outlined" {runtime_attrs}'
-            serialized_attrs = self._serialize_widget_attrs({**attrs, **num_props, **safe_props}, allow_event_handlers=True)
-            if serialized_attrs:
-                html += f' {serialized_attrs}'
-            html += f'></wa-input>'
-            
+
+            serialized_attrs = serialized_by_mode.get(self.mode)
+            if serialized_attrs is None:
+                attrs = _lite_input_attrs(cid) if self.mode == 'lite' else {}
+                serialized_attrs = serialized_by_mode[self.mode] = self._serialize_widget_attrs({**attrs, **num_props, **safe_props}, allow_event_handlers=True)
+            attrs_suffix = f' {serialized_attrs}' if serialized_attrs else ''
+
             _wd = self._get_widget_defaults("number_input")
             default_host_cls, default_auto_part_cls = auto_split_widget_cls("number_input", _wd.get("cls", ""))
             user_host_cls, user_auto_part_cls = auto_split_widget_cls("number_input", cls)
             _fc = merge_cls(default_host_cls, user_host_cls)
             _fs = merge_style(_wd.get("style", ""), style)
             _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
+            part_attr = ''
             if _part_cls:
                 runtime_init_names.append("part-bridge")
-                runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
                 part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"'
-                html = html.replace(f'<wa-input id="{cid}"', f'<wa-input id="{cid}"{part_attr}', 1)
-                html = html.replace(' appearance="outlined" ', f' appearance="outlined" {runtime_attrs} ', 1)
-            return Component(None, id=cid, content=wrap_html(html, _fc, _fs))
+            escaped_value = html_lib.escape(str(cv), quote=True)
+            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
+            html = f'<wa-input id="{cid}"{part_attr} label="{escaped_label}" value="{escaped_value}" appearance="outlined" {runtime_attrs}{attrs_suffix}></wa-input>'
+            return RawHTML(cid, wrap_html(html, _fc, _fs))
         
         self._register_component(cid, builder, action=action)
         return s
@@ -923,7 +1002,7 @@ class InputWidgetsMixin:
         
         s = self._resolve_widget_state("file", label, None, key=key, bind=bind)
         
-        def action(v):
+        def action(v=None):
             if v:
                 try:
                     # v might be a JSON string if from Lite mode
@@ -936,17 +1015,20 @@ class InputWidgetsMixin:
                         data = v
                     
                     if isinstance(data, dict):
-                        if "content" in data:
+                        if "content" in data or "data" in data:
                             # Single file
-                            uf = UploadedFile(data.get("name"), data.get("type"), data.get("size"), data.get("content"))
+                            uf = _uploaded_file_from_payload(data)
                             s.set(uf)
                             if on_change: on_change(uf)
                             return
                         elif "files" in data:
-                             # Multiple files
-                             files = []
-                             for f_data in data["files"]:
-                                 files.append(UploadedFile(f_data.get("name"), f_data.get("type"), f_data.get("size"), f_data.get("content")))
+                             # Multiple files: decode them in parallel, but wait here so
+                             # state and on_change still update inside this action.
+                             file_payloads = data["files"]
+                             if len(file_payloads) > 1:
+                                 files = list(_get_decode_pool().map(_uploaded_file_from_payload, file_payloads))
+                             else:
+                                 files = [_uploaded_file_from_payload(f_data) for f_data in file_payloads]
                              s.set(files)
                              if on_change: on_change(files)
                              return
@@ -956,6 +1038,15 @@ class InputWidgetsMixin:
             s.set(None)
             if on_change: on_change(None)
         
+        accept_str = html_lib.escape(str(accept if accept else "*"), quote=True)
+        safe_label = html_lib.escape(str(label))
+        help_html = f'<div style="font-size:0.75rem;color:var(--vl-text-muted);margin-top:0.25rem;">{html_lib.escape(str(help))}</div>' if help else ""
+        # Upload handling lives in the app runtime's "file-uploader" initializer
+        runtime_attrs = self._runtime_attr_string(
+            ["file-uploader"],
+            {"data-vl-file-uploader-config": {"cid": cid, "multiple": bool(multiple)}},
+        )
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
@@ -972,88 +1063,16 @@ class InputWidgetsMixin:
             else:
                 file_info = ""
             
-            accept_str = html_lib.escape(str(accept if accept else "*"), quote=True)
-            safe_label = html_lib.escape(str(label))
-            help_html = f'<div style="font-size:0.75rem;color:var(--vl-text-muted);margin-top:0.25rem;">{html_lib.escape(str(help))}</div>' if help else ""
             safe_file_info = html_lib.escape(str(file_info))
             
             html = f'''
             <div class="file-uploader">
                 <label style="display:block;margin-bottom:0.5rem;font-weight:500;color:var(--vl-text);">{safe_label}</label>
-                <input type="file" id="{cid}_input" accept="{accept_str}" {'multiple' if multiple else ''} 
+                <input type="file" id="{cid}_input" accept="{accept_str}" {'multiple' if multiple else ''} {runtime_attrs}
                        style="display:block;padding:0.5rem;border:1px solid var(--vl-border);border-radius:0.25rem;background:var(--vl-bg-card);color:var(--vl-text);width:100%;font-family:inherit;cursor:pointer;" />
                 {help_html}
                 <div id="{cid}_info" style="margin-top:0.5rem;font-size:0.875rem;color:var(--vl-text-muted);">{safe_file_info}</div>
             </div>
-            <script>
-            (function() {{
-                const input = document.getElementById('{cid}_input');
-                const infoDiv = document.getElementById('{cid}_info');
-                
-                if (input && !input.hasAttribute('data-listener-added')) {{
-                    input.setAttribute('data-listener-added', 'true');
-                    
-                    input.addEventListener('change', function(e) {{
-                        const files = e.target.files;
-                        if (files && files.length > 0) {{
-                            infoDiv.textContent = 'Uploading...';
-                            
-                            const fileArray = Array.from(files);
-                            const promises = fileArray.map(file => {{
-                                return new Promise((resolve, reject) => {{
-                                    const reader = new FileReader();
-                                    reader.onload = function(ev) {{
-                                        resolve({{
-                                            name: file.name,
-                                            type: file.type,
-                                            size: file.size,
-                                            content: ev.target.result
-                                        }});
-                                    }};
-                                    reader.onerror = function(err) {{
-                                        reject(err);
-                                    }};
-                                    reader.readAsDataURL(file);
-                                }});
-                            }});
-                            
-                            Promise.all(promises).then(function(results) {{
-                                let payload;
-                                if ({'true' if multiple else 'false'}) {{
-                                    payload = {{files: results}};
-                                }} else {{
-                                    payload = results[0];
-                                }}
-                                
-                                // Update UI immediately
-                                if ({'true' if multiple else 'false'}) {{
-                                    infoDiv.textContent = 'Uploaded ' + results.length + ' file(s)';
-                                }} else {{
-                                    const file = results[0];
-                                    const sizeKB = (file.size / 1024).toFixed(1);
-                                    infoDiv.textContent = 'Uploaded ' + file.name + ' (' + sizeKB + ' KB)';
-                                }}
-                                
-                                // Send to backend
-                                if (window.sendAction) {{
-                                    // WebSocket mode
-                                    window.sendAction('{cid}', payload);
-                                }} else if (window.htmx) {{
-                                    // HTMX mode
-                                    htmx.ajax('POST', '/action/{cid}', {{
-                                        values: {{ value: JSON.stringify(payload) }},
-                                        swap: 'none'
-                                    }});
-                                }}
-                            }}).catch(function(err) {{
-                                infoDiv.textContent = 'Upload failed';
-                                console.error('File upload error:', err);
-                            }});
-                        }}
-                    }});
-                }}
-            }})();
-            </script>
             '''
             _wd = self._get_widget_defaults("file_uploader")
             _fc = merge_cls(_wd.get("cls", ""), cls)
@@ -1076,6 +1095,7 @@ class InputWidgetsMixin:
         cid = self._resolve_widget_cid("toggle", key)
         user_part_cls = props.pop("part_cls", None)
         safe_props = self._normalize_public_widget_props(dict(props))
+        props_str = self._serialize_widget_attrs(safe_props)
         
         s = self._resolve_widget_state("toggle", label, value, key=key, bind=bind)
         
@@ -1084,44 +1104,27 @@ class InputWidgetsMixin:
             s.set(real_val)
             if on_change: on_change(real_val)
         
+        # The markup only varies with the checked state and the widget
+        # defaults, so each variant is built once until configure_widget runs.
+        built = {}
+
         def builder():
             # Subscribe to own state - client-side will handle smart updates
             token = rendering_ctx.set(cid)
-            cv = s.value
+            checked = bool(s.value)
             rendering_ctx.reset(token)
-            
-            checked_attr = 'checked' if cv else ''
-            props_str = self._serialize_widget_attrs(safe_props)
-            runtime_init_names = ["input-control"]
-            runtime_config = {
-                "cid": cid,
-                "eventName": "change",
-                "transport": "lite-direct" if self.mode == 'lite' else "ws",
-                "valueProp": "checked",
-                "desiredValue": bool(cv),
-            }
-            
-            if self.mode == 'lite':
-                attrs_str = ""
-            else:
-                attrs_str = ""
-            
-            disabled_attr = 'disabled' if disabled else ''
-            help_html = f'<br><span style="font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</span>' if help else ''
-            _wd = self._get_widget_defaults("toggle")
-            default_host_cls, default_auto_part_cls = auto_split_widget_cls("toggle", _wd.get("cls", ""))
-            user_host_cls, user_auto_part_cls = auto_split_widget_cls("toggle", cls)
-            _fc = merge_cls(default_host_cls, user_host_cls)
-            _fs = merge_style(_wd.get("style", ""), style)
-            _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
-            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"' if _part_cls else ''
-            if _part_cls:
-                runtime_init_names.append("part-bridge")
-                runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            safe_label = html_lib.escape(str(label))
-            html = f'<wa-switch id="{cid}"{part_attr} {runtime_attrs} {checked_attr} {disabled_attr} {attrs_str} {props_str}>{safe_label}{help_html}</wa-switch>'
-            return Component(None, id=cid, content=wrap_html(html, _fc, _fs))
+
+            defaults = self._widget_defaults.get("toggle")
+            if built.get("defaults", built) is not defaults:
+                built.clear()
+                built["defaults"] = defaults
+            html = built.get(checked)
+            if html is None:
+                html = built[checked] = self._checked_control_html(
+                    "toggle", "wa-switch", cid, checked, label, disabled, help,
+                    cls, style, user_part_cls, props_str,
+                )
+            return RawHTML(cid, html)
         self._register_component(cid, builder, action=action)
         return s
 
@@ -1143,15 +1146,18 @@ class InputWidgetsMixin:
             s.set(v)
             if on_change: on_change(v)
         
+        built = {}
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
+            # Skip the rebuild when neither the value nor the widget defaults changed
+            memo_key = (type(cv), cv, self.mode, self._widget_defaults.get("color_picker"))
+            if built.get("key") == memo_key:
+                return built["component"]
             
-            if self.mode == 'lite':
-                attrs = {"hx-post": f"/action/{cid}", "hx-trigger": "change", "hx-swap": "none", "name": "value"}
-            else:
-                attrs = {"onchange": f"window.sendAction('{cid}', this.value)"}
+            attrs = _CHANGE_ATTR_BUILDERS.get(self.mode, _ws_change_attrs)(cid)
             
             inner = Component(
                 "wa-color-picker",
@@ -1167,7 +1173,8 @@ class InputWidgetsMixin:
             _fc = merge_cls(_wd.get("cls", ""), cls)
             _fs = merge_style(_wd.get("style", ""), style)
             if _fc or _fs:
-                return Component("div", id=f"{cid}_wrap", content=inner.render(), class_=_fc or None, style=_fs or None)
+                inner = Component("div", id=f"{cid}_wrap", content=inner.render(), class_=_fc or None, style=_fs or None)
+            built["key"], built["component"] = memo_key, inner
             return inner
         
         self._register_component(cid, builder, action=action)
@@ -1175,29 +1182,36 @@ class InputWidgetsMixin:
 
     def date_input(self, label="Select date", value=None, key=None, on_change=None, help=None, cls: str = "", style: str = "", bind=None, **props):
         """Date picker widget"""
-        import datetime
         cid = self._resolve_widget_cid("date", key)
         safe_props = self._normalize_public_widget_props(dict(props))
-        default_val = value if value else datetime.date.today().isoformat()
+        default_val = value or datetime.date.today().isoformat()
         s = self._resolve_widget_state("date", label, default_val, key=key, bind=bind)
         
         def action(v):
             s.set(v)
             if on_change: on_change(v)
         
+        safe_label = html_lib.escape(str(label))
+        help_html = f'<div style="margin-top:0.25rem;font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</div>' if help else ''
+        serialized_by_mode = {}
+
+        built = {}
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
+            # Skip the rebuild when neither the value nor the widget defaults changed
+            memo_key = (type(cv), cv, self.mode, self._widget_defaults.get("date_input"))
+            if built.get("key") == memo_key:
+                return built["component"]
             
-            if self.mode == 'lite':
-                attrs = {"hx-post": f"/action/{cid}", "hx-trigger": "change", "hx-swap": "none", "name": "value"}
-            else:
-                attrs = {"onchange": f"window.sendAction('{cid}', this.value)"}
-            serialized_attrs = self._serialize_widget_attrs({**attrs, **safe_props}, allow_event_handlers=True)
-            safe_label = html_lib.escape(str(label))
+            # app.run() may still switch the mode after declaration
+            serialized_attrs = serialized_by_mode.get(self.mode)
+            if serialized_attrs is None:
+                attrs = _CHANGE_ATTR_BUILDERS.get(self.mode, _ws_change_attrs)(cid)
+                serialized_attrs = serialized_by_mode[self.mode] = self._serialize_widget_attrs({**attrs, **safe_props}, allow_event_handlers=True)
             safe_value = html_lib.escape(str(cv), quote=True)
-            help_html = f'<div style="margin-top:0.25rem;font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</div>' if help else ''
             
             html = f'''
             <div>
@@ -1211,36 +1225,45 @@ class InputWidgetsMixin:
             _wd = self._get_widget_defaults("date_input")
             _fc = merge_cls(_wd.get("cls", ""), cls)
             _fs = merge_style(_wd.get("style", ""), style)
-            return Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            component = Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            built["key"], built["component"] = memo_key, component
+            return component
         
         self._register_component(cid, builder, action=action)
         return s
 
     def time_input(self, label="Select time", value=None, key=None, on_change=None, help=None, cls: str = "", style: str = "", bind=None, **props):
         """Time picker widget"""
-        import datetime
         cid = self._resolve_widget_cid("time", key)
         safe_props = self._normalize_public_widget_props(dict(props))
-        default_val = value if value else datetime.datetime.now().strftime("%H:%M")
+        default_val = value or datetime.datetime.now().strftime("%H:%M")
         s = self._resolve_widget_state("time", label, default_val, key=key, bind=bind)
         
         def action(v):
             s.set(v)
             if on_change: on_change(v)
         
+        safe_label = html_lib.escape(str(label))
+        help_html = f'<div style="margin-top:0.25rem;font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</div>' if help else ''
+        serialized_by_mode = {}
+
+        built = {}
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
+            # Skip the rebuild when neither the value nor the widget defaults changed
+            memo_key = (type(cv), cv, self.mode, self._widget_defaults.get("time_input"))
+            if built.get("key") == memo_key:
+                return built["component"]
             
-            if self.mode == 'lite':
-                attrs = {"hx-post": f"/action/{cid}", "hx-trigger": "change", "hx-swap": "none", "name": "value"}
-            else:
-                attrs = {"onchange": f"window.sendAction('{cid}', this.value)"}
-            serialized_attrs = self._serialize_widget_attrs({**attrs, **safe_props}, allow_event_handlers=True)
-            safe_label = html_lib.escape(str(label))
+            # app.run() may still switch the mode after declaration
+            serialized_attrs = serialized_by_mode.get(self.mode)
+            if serialized_attrs is None:
+                attrs = _CHANGE_ATTR_BUILDERS.get(self.mode, _ws_change_attrs)(cid)
+                serialized_attrs = serialized_by_mode[self.mode] = self._serialize_widget_attrs({**attrs, **safe_props}, allow_event_handlers=True)
             safe_value = html_lib.escape(str(cv), quote=True)
-            help_html = f'<div style="margin-top:0.25rem;font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</div>' if help else ''
             
             html = f'''
             <div>
@@ -1254,36 +1277,45 @@ class InputWidgetsMixin:
             _wd = self._get_widget_defaults("time_input")
             _fc = merge_cls(_wd.get("cls", ""), cls)
             _fs = merge_style(_wd.get("style", ""), style)
-            return Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            component = Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            built["key"], built["component"] = memo_key, component
+            return component
         
         self._register_component(cid, builder, action=action)
         return s
 
     def datetime_input(self, label="Select date and time", value=None, key=None, on_change=None, help=None, cls: str = "", style: str = "", bind=None, **props):
         """DateTime picker widget"""
-        import datetime
         cid = self._resolve_widget_cid("datetime", key)
         safe_props = self._normalize_public_widget_props(dict(props))
-        default_val = value if value else datetime.datetime.now().strftime("%Y-%m-%dT%H:%M")
+        default_val = value or datetime.datetime.now().strftime("%Y-%m-%dT%H:%M")
         s = self._resolve_widget_state("datetime", label, default_val, key=key, bind=bind)
         
         def action(v):
             s.set(v)
             if on_change: on_change(v)
         
+        safe_label = html_lib.escape(str(label))
+        help_html = f'<div style="margin-top:0.25rem;font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</div>' if help else ''
+        serialized_by_mode = {}
+
+        built = {}
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
+            # Skip the rebuild when neither the value nor the widget defaults changed
+            memo_key = (type(cv), cv, self.mode, self._widget_defaults.get("datetime_input"))
+            if built.get("key") == memo_key:
+                return built["component"]
             
-            if self.mode == 'lite':
-                attrs = {"hx-post": f"/action/{cid}", "hx-trigger": "change", "hx-swap": "none", "name": "value"}
-            else:
-                attrs = {"onchange": f"window.sendAction('{cid}', this.value)"}
-            serialized_attrs = self._serialize_widget_attrs({**attrs, **safe_props}, allow_event_handlers=True)
-            safe_label = html_lib.escape(str(label))
+            # app.run() may still switch the mode after declaration
+            serialized_attrs = serialized_by_mode.get(self.mode)
+            if serialized_attrs is None:
+                attrs = _CHANGE_ATTR_BUILDERS.get(self.mode, _ws_change_attrs)(cid)
+                serialized_attrs = serialized_by_mode[self.mode] = self._serialize_widget_attrs({**attrs, **safe_props}, allow_event_handlers=True)
             safe_value = html_lib.escape(str(cv), quote=True)
-            help_html = f'<div style="margin-top:0.25rem;font-size:0.75rem;color:var(--vl-text-muted);">{html_lib.escape(str(help))}</div>' if help else ''
             
             html = f'''
             <div>
@@ -1297,7 +1329,9 @@ class InputWidgetsMixin:
             _wd = self._get_widget_defaults("datetime_input")
             _fc = merge_cls(_wd.get("cls", ""), cls)
             _fs = merge_style(_wd.get("style", ""), style)
-            return Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            component = Component("div", id=cid, content=html, class_=_fc or None, style=_fs or None)
+            built["key"], built["component"] = memo_key, component
+            return component
         
         self._register_component(cid, builder, action=action)
         return s
@@ -1307,6 +1341,7 @@ class InputWidgetsMixin:
         cid = self._resolve_widget_cid(type_name, key)
         user_part_cls = props.pop("part_cls", None)
         safe_props = self._normalize_public_widget_props(dict(props))
+        props_str = self._serialize_widget_attrs(safe_props)
         
         s = self._resolve_widget_state(type_name, label, value, key=key, bind=bind)
         
@@ -1327,7 +1362,7 @@ class InputWidgetsMixin:
                 v = payload
 
             if type_name == 'slider': 
-                v = float(v) if '.' in str(v) else int(v)
+                v = _parse_number(v)
             s.set(v)
             if submitted:
                 if on_submit:
@@ -1339,13 +1374,47 @@ class InputWidgetsMixin:
         
         # Web Awesome form controls emit native input/change events.
         input_event = 'input' if live_update else 'change'
-        
+        submit_on_enter = type_name == "input" and bool(on_submit)
+        # label_visibility support
+        _lbl = "" if label_visibility in ("hidden", "collapsed") else label
+        escaped_label = html_lib.escape(str(_lbl), quote=True)
+        user_host_cls, user_auto_part_cls = auto_split_widget_cls(type_name, cls)
+
+        built = {}
+        # Everything around the value and runtime config, keyed by (mode, widget defaults)
+        shell = {}
+
+        def build_shell(shell_key):
+            if self.mode == 'lite':
+                attrs_str = f'hx-post="/action/{cid}" hx-trigger="{input_event}" hx-swap="none" name="value"'
+            else:
+                attrs_str = ""
+            _wd = self._get_widget_defaults(type_name)
+            default_host_cls, default_auto_part_cls = auto_split_widget_cls(type_name, _wd.get("cls", ""))
+            _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
+            runtime_init_names = ["input-control"]
+            part_attr = ''
+            if _part_cls:
+                runtime_init_names.append("part-bridge")
+                part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"'
+            shell["key"] = shell_key
+            shell["init_names"] = runtime_init_names
+            shell["head"] = f'<{tag_name} id="{cid}"{part_attr} label="{escaped_label}" value="'
+            shell["tail"] = f' {attrs_str} {props_str}></{tag_name}>'
+            shell["cls"] = merge_cls(default_host_cls, user_host_cls)
+            shell["style"] = merge_style(_wd.get("style", ""), style)
+
         def builder():
             token = rendering_ctx.set(cid)
             cv = s.value
             rendering_ctx.reset(token)
-            submit_on_enter = type_name == "input" and bool(on_submit)
-            runtime_init_names = ["input-control"]
+            # Skip the rebuild when neither the value nor the widget defaults changed;
+            # the type is part of the key because 1, 1.0 and True compare equal
+            memo_key = (type(cv), cv, self.mode, self._widget_defaults.get(type_name))
+            if built.get("key") == memo_key:
+                return built["component"]
+            if shell.get("key") != memo_key[2:]:
+                build_shell(memo_key[2:])
             runtime_config = {
                 "cid": cid,
                 "eventName": input_event,
@@ -1355,36 +1424,11 @@ class InputWidgetsMixin:
                 "submitOnEnter": submit_on_enter,
                 "submitDirtyFlag": self.mode == 'lite' and submit_on_enter,
             }
-            
-            if self.mode == 'lite':
-                attrs_str = f'hx-post="/action/{cid}" hx-trigger="{input_event}" hx-swap="none" name="value"'
-            else:
-                attrs_str = ""
-            
-            props_str = self._serialize_widget_attrs(safe_props)
+            runtime_attrs = self._runtime_attr_string(shell["init_names"], {"data-vl-input-config": runtime_config})
             escaped_cv = html_lib.escape(str(cv), quote=True)
-            # label_visibility support
-            _lbl = label
-            if label_visibility == "hidden":
-                _lbl = ""
-            elif label_visibility == "collapsed":
-                _lbl = ""
-            escaped_label = html_lib.escape(str(_lbl), quote=True)
-            runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-            html = f'<{tag_name} id="{cid}" label="{escaped_label}" value="{escaped_cv}" appearance="outlined" {runtime_attrs} {attrs_str} {props_str}></{tag_name}>'
-            
-            _wd = self._get_widget_defaults(type_name)
-            default_host_cls, default_auto_part_cls = auto_split_widget_cls(type_name, _wd.get("cls", ""))
-            user_host_cls, user_auto_part_cls = auto_split_widget_cls(type_name, cls)
-            _fc = merge_cls(default_host_cls, user_host_cls)
-            _fs = merge_style(_wd.get("style", ""), style)
-            _part_cls = merge_part_cls(default_auto_part_cls, _wd.get("part_cls", {}), user_auto_part_cls, user_part_cls)
-            if _part_cls:
-                runtime_init_names.append("part-bridge")
-                runtime_attrs = self._runtime_attr_string(runtime_init_names, {"data-vl-input-config": runtime_config})
-                part_attr = f' data-vl-part-cls="{html_lib.escape(serialize_part_cls(_part_cls), quote=True)}"'
-                html = html.replace(f'<{tag_name} id="{cid}"', f'<{tag_name} id="{cid}"{part_attr}', 1)
-                html = html.replace(' appearance="outlined" ', f' appearance="outlined" {runtime_attrs} ', 1)
-            return Component(None, id=cid, content=wrap_html(html, _fc, _fs))
+            html = f'{shell["head"]}{escaped_cv}" appearance="outlined" {runtime_attrs}{shell["tail"]}'
+            component = RawHTML(cid, wrap_html(html, shell["cls"], shell["style"]))
+            built["key"], built["component"] = memo_key, component
+            return component
         self._register_component(cid, builder, action=action)
         return s
@@ -2,17 +2,30 @@
 
 import hashlib
 import html as html_lib
+import itertools
 import json
 import re
 
-from functools import wraps
+from functools import partial, wraps
 
 from typing import Any, Union, Callable, Optional, List, Sequence
-from ..component import Component
+from ..component import Component, RawHTML
 from ..context import rendering_ctx, fragment_ctx, layout_ctx, registration_pass_ctx, session_ctx
+from ..state import ComputedState, State, get_session_store
 from ..style_utils import merge_cls, merge_style
 
 
+_VERTICAL_ALIGN_MAP = {"top": "start", "center": "center", "bottom": "end"}
+
+# Inline visibility for active and collapsed tab panels
+_TAB_PANEL_ACTIVE_STYLE = 'display:block;height:auto;overflow:visible;pointer-events:auto;opacity:1;visibility:visible;'
+_TAB_PANEL_COLLAPSED_STYLE = 'display:block;height:0;overflow:hidden;pointer-events:none;opacity:0;visibility:hidden;'
+
+# Fixed column wrapper tags, shared by every columns render
+_COLUMN_ITEM_OPEN = '<div class="column-item">'
+_COLUMN_ITEM_BORDERED_OPEN = '<div class="column-item column-item--bordered">'
+
+
 def _reset_dynamic_fragment_children(fragment_id: str):
     """Clear runtime-only fragment children before a nested layout re-renders.
 
@@ -23,12 +36,47 @@ def _reset_dynamic_fragment_children(fragment_id: str):
     if session_ctx.get() is None:
         return
 
-    from ..state import get_session_store
-
     store = get_session_store()
     store['fragment_components'][fragment_id] = []
 
 
+def _bind_static_fragment_children(app, fragment_id: str):
+    """Return the app-level child list for a fragment declared at module level.
+
+    ``_register_component`` only ever appends to this list, so builders can keep
+    the reference instead of looking it up on every render. Runtime-declared
+    layouts never get static children and do not touch the app-level dict.
+    """
+    if session_ctx.get() is not None:
+        return ()
+    return app.static_fragment_components.setdefault(fragment_id, [])
+
+
+def _render_fragment_children(static_children, session_components: dict, fragment_id: str) -> List[str]:
+    """Render a fragment's static children, then its session children."""
+    session_children = session_components.get(fragment_id)
+    if not session_children:
+        # Common for untouched containers: skip the chain entirely
+        return [b().render() for _, b in static_children] if static_children else []
+    return [
+        b().render()
+        for _, b in itertools.chain(static_children, session_children)
+    ]
+
+
+def _delegate_app_attr(owner, app, name: str):
+    """Proxy a missing attribute to the app for layout context objects.
+
+    Bound app methods are cached on the owner so repeated calls such as
+    ``tab.button(...)`` resolve through the instance dict instead of going
+    through ``__getattr__`` every time. Plain values are not cached.
+    """
+    attr = getattr(app, name)
+    if callable(attr):
+        owner.__dict__[name] = attr
+    return attr
+
+
 def _sanitize_layout_key(value: Any) -> str:
     raw = str(value)
     normalized = re.sub(r"[^a-zA-Z0-9_-]", "_", raw)
@@ -44,7 +92,6 @@ def _sanitize_layout_key(value: Any) -> str:
 
 
 def _resolve_dynamic_layout_value(value: Any) -> Any:
-    from ..state import State, ComputedState
 
     if isinstance(value, (State, ComputedState)):
         return value.value
@@ -147,10 +194,16 @@ class LayoutWidgetsMixin:
             _reset_dynamic_fragment_children(col.col_id)
             column_objects.append(col)
         
+        grid_tmpl = " ".join(weights)
+        container_open = {}
+        column_children = [
+            (col.col_id, _bind_static_fragment_children(self, col.col_id))
+            for col in column_objects
+        ]
+
         # Register the columns container builder
         def builder():
-            from ..state import get_session_store
-            store = get_session_store()
+            session_children = get_session_store()['fragment_components']
 
             current_gap = _resolve_dynamic_layout_value(gap)
             current_vertical_alignment = _resolve_dynamic_layout_value(vertical_alignment)
@@ -160,49 +213,44 @@ class LayoutWidgetsMixin:
             current_align = _resolve_dynamic_layout_value(align)
             current_justify = _resolve_dynamic_layout_value(justify)
 
-            resolved_gap = _resolve_columns_gap(current_gap)
-            width_style = _resolve_group_width(current_width)
-            column_align = _resolve_flex_alignment(current_align, "align")
-            column_justify = _resolve_flex_alignment(current_justify, "justify")
+            # The grid open tag only changes when one of the layout inputs does
+            layout_key = (current_gap, current_vertical_alignment, current_border, current_width,
+                          current_equal_height, current_align, current_justify)
+            if container_open.get("key") != layout_key:
+                resolved_gap = _resolve_columns_gap(current_gap)
+                width_style = _resolve_group_width(current_width)
+                column_align = _resolve_flex_alignment(current_align, "align")
+                column_justify = _resolve_flex_alignment(current_justify, "justify")
             
-            grid_tmpl = " ".join(weights)
-            # Use CSS variable for grid-template-columns so it can be overridden by CSS
-            # The --vl-cols variable and gap are set inline, but display:grid is handled by CSS class
-            _va_map = {"top": "start", "center": "center", "bottom": "end"}
-            _va = _va_map.get(current_vertical_alignment, "start")
-            grid_align = "stretch" if (current_equal_height or column_align or column_justify) else _va
-            container_cls = merge_cls(
-                "columns",
-                "columns--bordered" if current_border else "",
-                "columns--equal-height" if current_equal_height else "",
-            )
-            column_item_cls = merge_cls(
-                "column-item",
-                "column-item--bordered" if current_border else "",
-            )
-            columns_html = []
-            for i in range(count):
-                col_id = f"{columns_id}_col_{i}"
-                col_content = []
-                for cid, b in self.static_fragment_components.get(col_id, []):
-                    col_content.append(b().render())
-                for cid, b in store['fragment_components'].get(col_id, []):
-                    col_content.append(b().render())
-                columns_html.append(
-                    f'<div class="{column_item_cls}">'
-                    f'{"".join(col_content)}</div>'
+                # Use CSS variable for grid-template-columns so it can be overridden by CSS
+                # The --vl-cols variable and gap are set inline, but display:grid is handled by CSS class
+                _va = _VERTICAL_ALIGN_MAP.get(current_vertical_alignment, "start")
+                grid_align = "stretch" if (current_equal_height or column_align or column_justify) else _va
+                container_cls = merge_cls(
+                    "columns",
+                    "columns--bordered" if current_border else "",
+                    "columns--equal-height" if current_equal_height else "",
                 )
-            joined_cols = "".join(columns_html)
-            container_style = f"--vl-cols: {grid_tmpl}; --vl-gap: {resolved_gap}; align-items: {grid_align};"
-            if column_align:
-                container_style += f" --vl-column-align: {column_align};"
-            if column_justify:
-                container_style += f" --vl-column-justify: {column_justify};"
-            if column_align or column_justify:
-                container_style += " --vl-column-single-child-height: auto;"
-            if width_style:
-                container_style = f"{container_style} {width_style}"
-            container_html = f'<div id="{columns_id}" class="{container_cls}" style="{container_style}">{joined_cols}</div>'
+                container_style = f"--vl-cols: {grid_tmpl}; --vl-gap: {resolved_gap}; align-items: {grid_align};"
+                if column_align:
+                    container_style += f" --vl-column-align: {column_align};"
+                if column_justify:
+                    container_style += f" --vl-column-justify: {column_justify};"
+                if column_align or column_justify:
+                    container_style += " --vl-column-single-child-height: auto;"
+                if width_style:
+                    container_style = f"{container_style} {width_style}"
+                container_open["key"] = layout_key
+                container_open["html"] = f'<div id="{columns_id}" class="{container_cls}" style="{container_style}">'
+            # One flat list of fragments for the whole grid, joined once
+            column_open = _COLUMN_ITEM_BORDERED_OPEN if current_border else _COLUMN_ITEM_OPEN
+            parts = [container_open["html"]]
+            for col_id, static_children in column_children:
+                parts.append(column_open)
+                parts.extend(_render_fragment_children(static_children, session_children, col_id))
+                parts.append('</div>')
+            parts.append('</div>')
+            container_html = "".join(parts)
             _wd = self._get_widget_defaults("columns")
             _fc = merge_cls(_wd.get("cls", ""), cls)
             _fs = merge_style(_wd.get("style", ""), style)
@@ -235,92 +283,6 @@ class LayoutWidgetsMixin:
                 app.button("Delete")
         """
         cid = self._resolve_widget_cid("container", key)
-        
-        class ContainerContext:
-            def __init__(self, app, container_id, border, height, user_cls, user_style,
-                         fill_height, align, justify, spacing, widget_gap, attrs):
-                self.app = app
-                self.container_id = container_id
-                self.border = border
-                self.height = height
-                self.user_cls = user_cls
-                self.user_style = user_style
-                self.fill_height = fill_height
-                self.align = align
-                self.justify = justify
-                self.spacing = spacing
-                self.widget_gap = widget_gap
-                self.attrs = attrs
-                
-            def __enter__(self):
-                # Register builder BEFORE entering context
-                def builder():
-                    from ..state import get_session_store
-                    store = get_session_store()
-                    
-                    # Render child components
-                    htmls = []
-                    # Static first
-                    for cid, b in self.app.static_fragment_components.get(self.container_id, []):
-                        htmls.append(b().render())
-                    # Dynamic next
-                    for cid, b in store['fragment_components'].get(self.container_id, []):
-                        htmls.append(b().render())
-                    
-                    border_class = "card" if self.border else ""
-                    inner_html = "".join(htmls)
-                    
-                    # Height support (scrollable container)
-                    layout_styles = []
-                    if self.height is not None:
-                        h = f"{self.height}px" if isinstance(self.height, (int, float)) else self.height
-                        layout_styles.append(f"height: {h}; overflow-y: auto;")
-
-                    if self.fill_height:
-                        layout_styles.append("height: 100%;")
-
-                    align_value = _resolve_flex_alignment(self.align, "align")
-                    justify_value = _resolve_flex_alignment(self.justify, "justify")
-                    if self.fill_height or align_value or justify_value:
-                        layout_styles.append("display: flex; flex-direction: column;")
-                    if align_value:
-                        layout_styles.append(f"align-items: {align_value};")
-                    if justify_value:
-                        layout_styles.append(f"justify-content: {justify_value};")
-
-                    current_spacing = _resolve_dynamic_layout_value(self.spacing)
-                    current_widget_gap = _resolve_dynamic_layout_value(self.widget_gap)
-                    _, runtime_profile, runtime_widget_gap = self.app._get_spacing_runtime_values()
-                    effective_profile = runtime_profile
-                    effective_widget_gap = runtime_widget_gap
-                    if current_spacing is not None:
-                        _, effective_profile, effective_widget_gap = self.app._resolve_spacing_values(current_spacing, None)
-                    normalized_local_widget_gap = self.app._normalize_spacing_widget_gap(current_widget_gap)
-                    if normalized_local_widget_gap is not None:
-                        effective_widget_gap = normalized_local_widget_gap
-                    layout_styles.append(self.app._build_spacing_css_vars(effective_profile, effective_widget_gap))
-                    
-                    _wd = self.app._get_widget_defaults("container")
-                    _fc = merge_cls(_wd.get("cls", ""), "fragment", border_class, self.user_cls)
-                    _fs = merge_style(_wd.get("style", ""), " ".join(layout_styles), self.user_style)
-                    # Pass kwargs to Component
-                    return Component("div", id=self.container_id, content=inner_html, class_=_fc or None, style=_fs or None, **self.attrs)
-                
-                self.app._register_component(self.container_id, builder)
-                _reset_dynamic_fragment_children(self.container_id)
-                
-                # Now set fragment context
-                from ..context import fragment_ctx
-                self.token = fragment_ctx.set(self.container_id)
-                return self
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                from ..context import fragment_ctx
-                fragment_ctx.reset(self.token)
-            
-            def __getattr__(self, name):
-                return getattr(self.app, name)
-        
         return ContainerContext(self, cid, border, height, cls, style, fill_height, align, justify, spacing, widget_gap, kwargs)
 
     def expander(self, label, expanded=False, icon=None, cls: str = "", style: str = "", key: Any = None):
@@ -332,104 +294,6 @@ class LayoutWidgetsMixin:
             icon: Optional icon (emoji or string) to display before the label
         """
         cid = self._resolve_widget_cid("expander", key)
-        summary_cid = f"{cid}__summary"
-        details_cid = f"{cid}__details"
-        
-        class ExpanderContext:
-            def __init__(self, app, expander_id, label, expanded, icon=None, user_cls="", user_style=""):
-                self.app = app
-                self.expander_id = expander_id
-                self.label = label
-                self.expanded = expanded
-                self.icon = icon
-                self.user_cls = user_cls
-                self.user_style = user_style
-                
-            def __enter__(self):
-                def summary_builder():
-                    from ..state import State, ComputedState
-
-                    token = rendering_ctx.set(summary_cid)
-                    try:
-                        if isinstance(self.label, (State, ComputedState)):
-                            resolved_label = str(self.label.value)
-                        elif callable(self.label):
-                            resolved_label = str(self.label())
-                        else:
-                            resolved_label = str(self.label)
-
-                        if isinstance(self.icon, (State, ComputedState)):
-                            resolved_icon = str(self.icon.value)
-                        elif callable(self.icon):
-                            resolved_icon = str(self.icon())
-                        else:
-                            resolved_icon = str(self.icon) if self.icon is not None else ""
-                    finally:
-                        rendering_ctx.reset(token)
-
-                    icon_html = f'{resolved_icon} ' if resolved_icon else ''
-                    return Component(
-                        "span",
-                        id=summary_cid,
-                        content=f"{icon_html}{resolved_label}",
-                        slot="summary",
-                        style="font-weight:500;",
-                    )
-
-                if session_ctx.get() is None:
-                    self.app.static_builders[summary_cid] = summary_builder
-                else:
-                    from ..state import get_session_store
-                    store = get_session_store()
-                    store['builders'][summary_cid] = summary_builder
-
-                # Register builder BEFORE entering context
-                def builder():
-                    from ..state import get_session_store
-                    store = get_session_store()
-                    
-                    # Render child components
-                    htmls = []
-                    # Static
-                    for cid, b in self.app.static_fragment_components.get(self.expander_id, []):
-                        htmls.append(b().render())
-                    # Dynamic
-                    for cid, b in store['fragment_components'].get(self.expander_id, []):
-                        htmls.append(b().render())
-                    
-                    inner_html = "".join(htmls)
-                    open_attr = "open" if self.expanded else ""
-                    summary_html = summary_builder().render()
-                    expander_config = html_lib.escape(json.dumps({
-                        "storageKey": f"vl_expander_open:{self.expander_id}",
-                        "serverOpen": bool(self.expanded),
-                    }, ensure_ascii=False, separators=(",", ":")), quote=True)
-                    html = f'''
-                    <wa-details id="{details_cid}" data-vl-init="expander-persistence" data-vl-expander-config="{expander_config}" {open_attr}>
-                        {summary_html}
-                        <div style="padding:0.5rem 0; display:flex; flex-direction:column; width:100%; min-width:0;">{inner_html}</div>
-                    </wa-details>
-                    '''
-                    _wd = self.app._get_widget_defaults("expander")
-                    _fc = merge_cls(_wd.get("cls", ""), self.user_cls)
-                    _fs = merge_style(_wd.get("style", ""), self.user_style)
-                    return Component("div", id=self.expander_id, content=html, class_=_fc or None, style=_fs or None)
-                
-                self.app._register_component(self.expander_id, builder)
-                _reset_dynamic_fragment_children(self.expander_id)
-                
-                # Now set fragment context for children
-                from ..context import fragment_ctx
-                self.token = fragment_ctx.set(self.expander_id)
-                return self
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                from ..context import fragment_ctx
-                fragment_ctx.reset(self.token)
-            
-            def __getattr__(self, name):
-                return getattr(self.app, name)
-        
         return ExpanderContext(self, cid, label, expanded, icon, cls, style)
 
     def tabs(self, labels: List[str], cls: str = "", style: str = "", *, key: Any = None):
@@ -443,206 +307,39 @@ class LayoutWidgetsMixin:
                  rerenders when surrounding component order can change.
         """
         cid = self._resolve_widget_cid("tabs", key)
-        
-        class TabsManager:
-            def __init__(self, app, tabs_id, labels, user_cls="", user_style=""):
-                self.app = app
-                self.tabs_id = tabs_id
-                self.labels = labels
-                self.user_cls = user_cls
-                self.user_style = user_style
-                self.tab_objects = []
-                self.panel_names = [f"panel-{i}" for i in range(len(self.labels))]
-                self.default_panel = self.panel_names[0] if self.panel_names else ""
-                self.active_tab_state = self.app.state(self.default_panel, key=f"{self.tabs_id}__active_tab")
-                self.action_cid = f"{self.tabs_id}__active_tab_action"
-                
-                # Create tab objects immediately
-                for i, label in enumerate(self.labels):
-                    tab_obj = TabObject(self.app, f"{self.tabs_id}_tab_{i}", label, i == 0)
-                    _reset_dynamic_fragment_children(tab_obj.tab_id)
-                    self.tab_objects.append(tab_obj)
-
-                def tab_action(panel_name):
-                    if panel_name in self.panel_names:
-                        self.active_tab_state.set(panel_name)
-
-                self.app.static_actions[self.action_cid] = tab_action
-                
-                # Register tabs builder immediately
-                self._register_builder()
-
-            def _register_builder(self):
-                def builder():
-                    from ..state import get_session_store
-                    store = get_session_store()
-                    store['actions'][self.action_cid] = self.app.static_actions[self.action_cid]
-
-                    active_panel = self.active_tab_state.value
-                    if active_panel not in self.panel_names:
-                        active_panel = self.default_panel
-                    group_id = f"{self.tabs_id}_group"
-                    
-                    # Build tab headers
-                    headers = []
-                    for i, label in enumerate(self.labels):
-                        panel_name = self.panel_names[i]
-                        headers.append(f'<wa-tab slot="nav" panel="{panel_name}">{label}</wa-tab>')
-                    
-                    # Build tab panels
-                    panels = []
-                    for i, tab_obj in enumerate(self.tab_objects):
-                        panel_name = self.panel_names[i]
-                        is_active_panel = panel_name == active_panel
-                        # Render tab content
-                        tab_htmls = []
-                        # Check static
-                        for cid, b in self.app.static_fragment_components.get(tab_obj.tab_id, []):
-                            tab_htmls.append(b().render())
-                        # Check session
-                        for cid, b in store['fragment_components'].get(tab_obj.tab_id, []):
-                            tab_htmls.append(b().render())
-                        
-                        panel_content = "".join(tab_htmls)
-                        panel_attr = 'active' if is_active_panel else ''
-                        panel_state = 'active' if is_active_panel else 'collapsed'
-                        panel_style = (
-                            'display:block;height:auto;overflow:visible;pointer-events:auto;opacity:1;visibility:visible;'
-                            if is_active_panel else
-                            'display:block;height:0;overflow:hidden;pointer-events:none;opacity:0;visibility:hidden;'
-                        )
-                        panel_aria_hidden = 'false' if is_active_panel else 'true'
-                        panels.append(
-                            f'<wa-tab-panel name="{panel_name}" {panel_attr} data-vl-tab-state="{panel_state}" '
-                            f'aria-hidden="{panel_aria_hidden}" style="{panel_style}">{panel_content}</wa-tab-panel>'
-                        )
-
-                    tabs_config = html_lib.escape(json.dumps({
-                        "storageKey": f"vl_active_tab:{self.tabs_id}",
-                        "validPanels": self.panel_names,
-                        "defaultPanel": self.default_panel,
-                        "serverPanel": active_panel,
-                        "actionCid": self.action_cid,
-                        "syncServer": False,
-                    }, ensure_ascii=False, separators=(",", ":")), quote=True)
-                    
-                    html = f'''
-                    <wa-tab-group id="{group_id}" active="{active_panel}" data-vl-init="tabs-persistence" data-vl-tabs-config="{tabs_config}">
-                        {"".join(headers)}
-                        {"".join(panels)}
-                    </wa-tab-group>
-                    '''
-                    _wd = self.app._get_widget_defaults("tabs")
-                    _fc = merge_cls(_wd.get("cls", ""), self.user_cls)
-                    _fs = merge_style(_wd.get("style", ""), self.user_style)
-                    return Component("div", id=self.tabs_id, content=html, class_=_fc or None, style=_fs or None)
-                
-                self.app._register_component(self.tabs_id, builder)
-
-            def __enter__(self):
-                return self.tab_objects
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                pass
-            
-            # Make it iterable and indexable
-            def __iter__(self):
-                return iter(self.tab_objects)
-            
-            def __getitem__(self, index):
-                return self.tab_objects[index]
-            
-            def __len__(self):
-                return len(self.tab_objects)
-        
         return TabsManager(self, cid, labels, cls, style)
 
     def empty(self, key: Any = None):
         """Create an empty container that can be updated later"""
         cid = self._resolve_widget_cid("empty", key)
         _app = self
+        static_children = _bind_static_fragment_children(self, cid)
+        empty_html = f'<div id="{html_lib.escape(str(cid), quote=True)}"></div>'
 
         # Register the empty placeholder builder.
         # Renders dynamic (session) fragment children when present,
         # falls back to static (initial-render) children otherwise.
         def builder():
-            from ..state import get_session_store
-            from ..context import rendering_ctx
             store = get_session_store()
 
+            dyn = store['fragment_components'].get(cid)
+            children = dyn if dyn is not None else static_children
+            if not children:
+                return RawHTML(cid, empty_html)
+
             token = rendering_ctx.set(cid)
             htmls = []
-            dyn = store['fragment_components'].get(cid)
-            if dyn is not None:
-                for child_cid, b in dyn:
-                    try:
-                        htmls.append(b().render())
-                    except Exception:
-                        pass
-            else:
-                for child_cid, b in _app.static_fragment_components.get(cid, []):
-                    try:
-                        htmls.append(b().render())
-                    except Exception:
-                        pass
+            for child_cid, b in children:
+                try:
+                    htmls.append(b().render())
+                except Exception:
+                    pass
             rendering_ctx.reset(token)
             return Component("div", id=cid, content="".join(htmls))
 
         _app._register_component(cid, builder)
 
-        class EmptyContainer:
-            """Proxy object for the empty placeholder widget."""
-
-            @property
-            def container_id(self_):
-                return cid
-
-            def container(self_):
-                """Context manager; write widget calls inside the placeholder."""
-                class _PlaceholderCtx:
-                    def __enter__(ctx_self):
-                        from ..state import get_session_store
-                        from ..context import fragment_ctx
-                        store = get_session_store()
-                        # Clear previous dynamic children so they don't accumulate
-                        store['fragment_components'][cid] = []
-                        ctx_self._token = fragment_ctx.set(cid)
-                        return ctx_self
-
-                    def __exit__(ctx_self, *_):
-                        from ..context import fragment_ctx, session_ctx
-                        from ..state import get_session_store
-                        fragment_ctx.reset(ctx_self._token)
-                        # Only force a follow-up dirty update when mutating outside an active render pass.
-                        if _should_mark_placeholder_dirty():
-                            store = get_session_store()
-                            store.setdefault('forced_dirty', set()).add(cid)
-
-                return _PlaceholderCtx()
-
-            def empty(self_):
-                """Clear the placeholder content."""
-                from ..state import get_session_store
-                store = get_session_store()
-                store['fragment_components'][cid] = []
-                if _should_mark_placeholder_dirty():
-                    store.setdefault('forced_dirty', set()).add(cid)
-
-            def write(self_, content):
-                """Replace placeholder content with a plain string."""
-                from ..state import get_session_store
-                write_cid = f"{cid}_write"
-                def _write_builder():
-                    return Component(None, id=write_cid, content=str(content))
-                store = get_session_store()
-                store['fragment_components'][cid] = [(write_cid, _write_builder)]
-                if _should_mark_placeholder_dirty():
-                    store.setdefault('forced_dirty', set()).add(cid)
-
-            def __getattr__(self_, name):
-                return getattr(_app, name)
-
-        return EmptyContainer()
+        return EmptyContainer(_app, cid)
 
     def dialog(self, title, width="small", key: Any = None):
         """Create a modal dialog (decorator)
@@ -663,8 +360,6 @@ class LayoutWidgetsMixin:
                 if session_ctx.get() is None:
                     return None
 
-                from ..state import get_session_store
-
                 store = get_session_store()
                 fragment_children = list(store.get('fragment_components', {}).get(dialog_id, []))
                 cleanup_subtree = getattr(self, "_cleanup_runtime_component_subtree", None)
@@ -676,28 +371,28 @@ class LayoutWidgetsMixin:
                     store.setdefault('forced_dirty', set()).add(dialog_id)
                 return store
 
+            # The dialog shell never changes, so only the children are rendered per call
+            dialog_config = html_lib.escape(json.dumps({
+                "actionCid": dialog_id,
+            }, ensure_ascii=False, separators=(",", ":")), quote=True)
+            safe_title = html_lib.escape(str(title), quote=True)
+            dialog_open = f'''
+                <wa-dialog id="{modal_id}" label="{safe_title}" open light-dismiss style="--width: {dialog_width};" data-vl-init="dialog-auto-open" data-vl-dialog-config="{dialog_config}">
+                    <div style="padding:1rem;">'''
+            closed_html = f'<div id="{html_lib.escape(str(dialog_id), quote=True)}"></div>'
+            dialog_close = '''</div>
+                </wa-dialog>
+                '''
+
             def builder():
-                from ..state import get_session_store
                 store = get_session_store()
 
-                htmls = []
-                for child_cid, child_builder in store['fragment_components'].get(dialog_id, []):
-                    htmls.append(child_builder().render())
+                htmls = [child_builder().render() for _, child_builder in store['fragment_components'].get(dialog_id, ())]
 
                 inner_html = "".join(htmls)
                 if not inner_html:
-                    return Component("div", id=dialog_id, content="")
-
-                dialog_config = html_lib.escape(json.dumps({
-                    "actionCid": dialog_id,
-                }, ensure_ascii=False, separators=(",", ":")), quote=True)
-
-                html = f'''
-                <wa-dialog id="{modal_id}" label="{title}" open light-dismiss style="--width: {dialog_width};" data-vl-init="dialog-auto-open" data-vl-dialog-config="{dialog_config}">
-                    <div style="padding:1rem;">{inner_html}</div>
-                </wa-dialog>
-                '''
-                return Component("div", id=dialog_id, content=html)
+                    return RawHTML(dialog_id, closed_html)
+                return Component("div", id=dialog_id, content=f"{dialog_open}{inner_html}{dialog_close}")
 
             def close_dialog(*args, **kwargs):
                 _clear_runtime_dialog_children(mark_dirty=True)
@@ -713,7 +408,6 @@ class LayoutWidgetsMixin:
             
             # Create a function to open the dialog
             def open_dialog(*args, **kwargs):
-                from ..state import get_session_store
                 _clear_runtime_dialog_children(mark_dirty=False)
                 store = get_session_store()
 
@@ -725,7 +419,6 @@ class LayoutWidgetsMixin:
 
                 fragment_ctx.reset(token)
                 
-                from ..context import session_ctx
                 sid = session_ctx.get()
                         
                 # Force dirty to update it immediately
@@ -754,57 +447,6 @@ class LayoutWidgetsMixin:
                     app.styled_card(...)
         """
         cid = id or self._resolve_widget_cid("list_container", key)
-        
-        class ListContainerContext:
-            def __init__(self, app, container_id, gap, style_props):
-                self.app = app
-                self.container_id = container_id
-                self.gap = gap
-                self.style_props = style_props
-                
-            def __enter__(self):
-                # Register builder
-                def builder():
-                    from ..state import get_session_store
-                    store = get_session_store()
-                    
-                    # Render child components
-                    htmls = []
-                    # Static
-                    for cid, b in self.app.static_fragment_components.get(self.container_id, []):
-                        htmls.append(b().render())
-                    # Dynamic
-                    for cid, b in store['fragment_components'].get(self.container_id, []):
-                        htmls.append(b().render())
-                    
-                    # Use predefined class + optional customizations
-                    extra_styles = []
-                    if self.gap:
-                        extra_styles.append(f"gap: {self.gap}")
-                    for k, v in self.style_props.items():
-                        extra_styles.append(f"{k.replace('_', '-')}: {v}")
-                    
-                    style_str = "; ".join(extra_styles) if extra_styles else None
-                    
-                    inner_html = "".join(htmls)
-                    if style_str:
-                        return Component("div", id=self.container_id, content=inner_html, class_="violit-list-container", style=style_str)
-                    else:
-                        return Component("div", id=self.container_id, content=inner_html, class_="violit-list-container")
-                
-                self.app._register_component(self.container_id, builder)
-                _reset_dynamic_fragment_children(self.container_id)
-                
-                # Set fragment context
-                self.token = fragment_ctx.set(self.container_id)
-                return self
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                fragment_ctx.reset(self.token)
-            
-            def __getattr__(self, name):
-                return getattr(self.app, name)
-        
         return ListContainerContext(self, cid, gap, style_props)
 
     def popover(self, label, use_container_width=False, disabled=False, help=None, cls: str = "", style: str = "", key: Any = None):
@@ -824,64 +466,440 @@ class LayoutWidgetsMixin:
                 app.slider("Volume", 0, 100, 50)
         """
         cid = self._resolve_widget_cid("popover", key)
-        
-        class PopoverContext:
-            def __init__(self, app, popover_id, label, use_container_width, disabled, help_text, user_cls, user_style):
-                self.app = app
-                self.popover_id = popover_id
-                self.label = label
-                self.use_container_width = use_container_width
-                self.disabled = disabled
-                self.help_text = help_text
-                self.user_cls = user_cls
-                self.user_style = user_style
-                
-            def __enter__(self):
-                def builder():
-                    from ..state import get_session_store
-                    store = get_session_store()
-                    
-                    htmls = []
-                    for child_cid, b in self.app.static_fragment_components.get(self.popover_id, []):
-                        htmls.append(b().render())
-                    for child_cid, b in store['fragment_components'].get(self.popover_id, []):
-                        htmls.append(b().render())
-                    
-                    inner_html = "".join(htmls)
-                    
-                    disabled_attr = 'disabled' if self.disabled else ''
-                    width_style = 'style="width:100%;"' if self.use_container_width else ''
-                    help_attr = f'title="{self.help_text}"' if self.help_text else ''
-                    
-                    html = f'''
-                    <wa-dropdown id="{self.popover_id}" {disabled_attr}>
-                        <wa-button slot="trigger" with-caret variant="neutral" appearance="outlined" {disabled_attr} {width_style} {help_attr}>
-                            {self.label}
-                        </wa-button>
-                        <div style="padding: 1rem; background: var(--wa-color-surface-raised, var(--vl-bg-card)); border-radius: var(--wa-border-radius-m, var(--vl-radius)); min-width: 200px; max-width: 400px; box-shadow: 0 18px 38px rgba(15, 23, 42, 0.18);">
-                            {inner_html}
-                        </div>
-                    </wa-dropdown>
-                    '''
-                    _wd = self.app._get_widget_defaults("popover")
-                    _fc = merge_cls(_wd.get("cls", ""), self.user_cls)
-                    _fs = merge_style(_wd.get("style", ""), self.user_style)
-                    return Component("div", id=f"{self.popover_id}_wrap", content=html, class_=_fc or None, style=_fs or None)
-                
-                self.app._register_component(self.popover_id, builder)
-                _reset_dynamic_fragment_children(self.popover_id)
-                self.token = fragment_ctx.set(self.popover_id)
-                return self
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                fragment_ctx.reset(self.token)
-            
-            def __getattr__(self, name):
-                return getattr(self.app, name)
-        
         return PopoverContext(self, cid, label, use_container_width, disabled, help, cls, style)
 
 
+class TabsManager:
+    """Tab group returned by ``tabs()``; iterable over its ``TabObject`` panels"""
+    def __init__(self, app, tabs_id, labels, user_cls="", user_style=""):
+        self.app = app
+        self.tabs_id = tabs_id
+        self.labels = labels
+        self.user_cls = user_cls
+        self.user_style = user_style
+        self.tab_objects = []
+        self.panel_names = [f"panel-{i}" for i in range(len(self.labels))]
+        self.default_panel = self.panel_names[0] if self.panel_names else ""
+        self.active_tab_state = self.app.state(self.default_panel, key=f"{self.tabs_id}__active_tab")
+        self.action_cid = f"{self.tabs_id}__active_tab_action"
+
+        # Create tab objects immediately
+        for i, label in enumerate(self.labels):
+            tab_obj = TabObject(self.app, f"{self.tabs_id}_tab_{i}", label, i == 0)
+            _reset_dynamic_fragment_children(tab_obj.tab_id)
+            self.tab_objects.append(tab_obj)
+
+        def tab_action(panel_name):
+            if panel_name in self.panel_names:
+                self.active_tab_state.set(panel_name)
+
+        self.app.static_actions[self.action_cid] = tab_action
+
+        # Register tabs builder immediately
+        self._register_builder()
+
+    def _register_builder(self):
+        # Headers and both panel open-tag variants only depend on the labels,
+        # so one pass here leaves the builder to pick a variant per panel
+        nav_parts = []
+        tab_panels = []
+        for panel_name, label, tab_obj in zip(self.panel_names, self.labels, self.tab_objects):
+            nav_parts.append(f'<wa-tab slot="nav" panel="{panel_name}">{label}</wa-tab>')
+            tab_panels.append((
+                panel_name,
+                tab_obj.tab_id,
+                _bind_static_fragment_children(self.app, tab_obj.tab_id),
+                f'<wa-tab-panel name="{panel_name}" active data-vl-tab-state="active" '
+                f'aria-hidden="false" style="{_TAB_PANEL_ACTIVE_STYLE}">',
+                f'<wa-tab-panel name="{panel_name}"  data-vl-tab-state="collapsed" '
+                f'aria-hidden="true" style="{_TAB_PANEL_COLLAPSED_STYLE}">',
+            ))
+        nav_html = "".join(nav_parts)
+        group_id = f"{self.tabs_id}_group"
+        # The group open tag only varies with the server-side active panel
+        group_open_by_panel = {}
+
+        def builder():
+            store = get_session_store()
+            store['actions'][self.action_cid] = self.app.static_actions[self.action_cid]
+
+            active_panel = self.active_tab_state.value
+            if active_panel not in self.panel_names:
+                active_panel = self.default_panel
+
+            group_open = group_open_by_panel.get(active_panel)
+            if group_open is None:
+                tabs_config = html_lib.escape(json.dumps({
+                    "storageKey": f"vl_active_tab:{self.tabs_id}",
+                    "validPanels": self.panel_names,
+                    "defaultPanel": self.default_panel,
+                    "serverPanel": active_panel,
+                    "actionCid": self.action_cid,
+                    "syncServer": False,
+                }, ensure_ascii=False, separators=(",", ":")), quote=True)
+                group_open = group_open_by_panel[active_panel] = (
+                    f'<wa-tab-group id="{group_id}" active="{active_panel}" data-vl-init="tabs-persistence" data-vl-tabs-config="{tabs_config}">'
+                )
+
+            # Headers, panels and their children go into one flat list, joined once
+            parts = [group_open, nav_html]
+            session_children = store['fragment_components']
+            for panel_name, tab_id, static_children, active_open, collapsed_open in tab_panels:
+                parts.append(active_open if panel_name == active_panel else collapsed_open)
+                parts.extend(_render_fragment_children(static_children, session_children, tab_id))
+                parts.append('</wa-tab-panel>')
+            parts.append('</wa-tab-group>')
+            html = "".join(parts)
+            _wd = self.app._get_widget_defaults("tabs")
+            _fc = merge_cls(_wd.get("cls", ""), self.user_cls)
+            _fs = merge_style(_wd.get("style", ""), self.user_style)
+            return Component("div", id=self.tabs_id, content=html, class_=_fc or None, style=_fs or None)
+
+        self.app._register_component(self.tabs_id, builder)
+
+    def __enter__(self):
+        return self.tab_objects
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    # Make it iterable and indexable
+    def __iter__(self):
+        return iter(self.tab_objects)
+
+    def __getitem__(self, index):
+        return self.tab_objects[index]
+
+    def __len__(self):
+        return len(self.tab_objects)
+
+
+class _PlaceholderContext:
+    """Context manager returned by ``EmptyContainer.container()``"""
+    def __init__(self, cid):
+        self.cid = cid
+
+    def __enter__(self):
+        store = get_session_store()
+        # Clear previous dynamic children so they don't accumulate
+        store['fragment_components'][self.cid] = []
+        self._token = fragment_ctx.set(self.cid)
+        return self
+
+    def __exit__(self, *_):
+        fragment_ctx.reset(self._token)
+        # Only force a follow-up dirty update when mutating outside an active render pass.
+        if _should_mark_placeholder_dirty():
+            store = get_session_store()
+            store.setdefault('forced_dirty', set()).add(self.cid)
+
+
+class EmptyContainer:
+    """Proxy object for the empty placeholder widget."""
+    def __init__(self, app, cid):
+        self.app = app
+        self.cid = cid
+
+    @property
+    def container_id(self):
+        return self.cid
+
+    def container(self):
+        """Context manager; write widget calls inside the placeholder."""
+        return _PlaceholderContext(self.cid)
+
+    def empty(self):
+        """Clear the placeholder content."""
+        store = get_session_store()
+        store['fragment_components'][self.cid] = []
+        if _should_mark_placeholder_dirty():
+            store.setdefault('forced_dirty', set()).add(self.cid)
+
+    def write(self, content):
+        """Replace placeholder content with a plain string."""
+        write_cid = f"{self.cid}_write"
+        # Content is per session, so it lives in the store; partial avoids a closure per write
+        store = get_session_store()
+        store['fragment_components'][self.cid] = [(write_cid, partial(RawHTML, write_cid, str(content)))]
+        if _should_mark_placeholder_dirty():
+            store.setdefault('forced_dirty', set()).add(self.cid)
+
+    def __getattr__(self, name):
+        return _delegate_app_attr(self, self.app, name)
+
+
+class ContainerContext:
+    """Context manager returned by ``container()``"""
+    def __init__(self, app, container_id, border, height, user_cls, user_style,
+                 fill_height, align, justify, spacing, widget_gap, attrs):
+        self.app = app
+        self.container_id = container_id
+        self.border = border
+        self.height = height
+        self.user_cls = user_cls
+        self.user_style = user_style
+        self.fill_height = fill_height
+        self.align = align
+        self.justify = justify
+        self.spacing = spacing
+        self.widget_gap = widget_gap
+        self.attrs = attrs
+
+    def __enter__(self):
+        self._static_children = _bind_static_fragment_children(self.app, self.container_id)
+
+        # Register builder BEFORE entering context
+        def builder():
+            store = get_session_store()
+
+            # Render child components (static first, then dynamic)
+            htmls = _render_fragment_children(self._static_children, store['fragment_components'], self.container_id)
+
+            border_class = "card" if self.border else ""
+            inner_html = "".join(htmls)
+
+            # Height support (scrollable container)
+            layout_styles = []
+            if self.height is not None:
+                h = f"{self.height}px" if isinstance(self.height, (int, float)) else self.height
+                layout_styles.append(f"height: {h}; overflow-y: auto;")
+
+            if self.fill_height:
+                layout_styles.append("height: 100%;")
+
+            align_value = _resolve_flex_alignment(self.align, "align")
+            justify_value = _resolve_flex_alignment(self.justify, "justify")
+            if self.fill_height or align_value or justify_value:
+                layout_styles.append("display: flex; flex-direction: column;")
+            if align_value:
+                layout_styles.append(f"align-items: {align_value};")
+            if justify_value:
+                layout_styles.append(f"justify-content: {justify_value};")
+
+            current_spacing = _resolve_dynamic_layout_value(self.spacing)
+            current_widget_gap = _resolve_dynamic_layout_value(self.widget_gap)
+            _, runtime_profile, runtime_widget_gap = self.app._get_spacing_runtime_values()
+            effective_profile = runtime_profile
+            effective_widget_gap = runtime_widget_gap
+            if current_spacing is not None:
+                _, effective_profile, effective_widget_gap = self.app._resolve_spacing_values(current_spacing, None)
+            normalized_local_widget_gap = self.app._normalize_spacing_widget_gap(current_widget_gap)
+            if normalized_local_widget_gap is not None:
+                effective_widget_gap = normalized_local_widget_gap
+            layout_styles.append(self.app._build_spacing_css_vars(effective_profile, effective_widget_gap))
+
+            _wd = self.app._get_widget_defaults("container")
+            _fc = merge_cls(_wd.get("cls", ""), "fragment", border_class, self.user_cls)
+            _fs = merge_style(_wd.get("style", ""), " ".join(layout_styles), self.user_style)
+            # Pass kwargs to Component
+            return Component("div", id=self.container_id, content=inner_html, class_=_fc or None, style=_fs or None, **self.attrs)
+
+        self.app._register_component(self.container_id, builder)
+        _reset_dynamic_fragment_children(self.container_id)
+
+        # Now set fragment context
+        self.token = fragment_ctx.set(self.container_id)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        fragment_ctx.reset(self.token)
+
+    def __getattr__(self, name):
+        return _delegate_app_attr(self, self.app, name)
+
+
+class ExpanderContext:
+    """Context manager returned by ``expander()``"""
+    def __init__(self, app, expander_id, label, expanded, icon=None, user_cls="", user_style=""):
+        self.app = app
+        self.expander_id = expander_id
+        self.label = label
+        self.expanded = expanded
+        self.icon = icon
+        self.user_cls = user_cls
+        self.user_style = user_style
+        self.summary_cid = f"{expander_id}__summary"
+        self.details_cid = f"{expander_id}__details"
+
+    def __enter__(self):
+        summary_cid = self.summary_cid
+        details_cid = self.details_cid
+        self._static_children = _bind_static_fragment_children(self.app, self.expander_id)
+
+        def summary_builder():
+            token = rendering_ctx.set(summary_cid)
+            try:
+                if isinstance(self.label, (State, ComputedState)):
+                    resolved_label = str(self.label.value)
+                elif callable(self.label):
+                    resolved_label = str(self.label())
+                else:
+                    resolved_label = str(self.label)
+
+                if isinstance(self.icon, (State, ComputedState)):
+                    resolved_icon = str(self.icon.value)
+                elif callable(self.icon):
+                    resolved_icon = str(self.icon())
+                else:
+                    resolved_icon = str(self.icon) if self.icon is not None else ""
+            finally:
+                rendering_ctx.reset(token)
+
+            icon_html = f'{resolved_icon} ' if resolved_icon else ''
+            return Component(
+                "span",
+                id=summary_cid,
+                content=f"{icon_html}{resolved_label}",
+                slot="summary",
+                style="font-weight:500;",
+            )
+
+        if session_ctx.get() is None:
+            self.app.static_builders[summary_cid] = summary_builder
+        else:
+            store = get_session_store()
+            store['builders'][summary_cid] = summary_builder
+
+        # The details open tag only depends on fixed constructor args
+        expander_config = html_lib.escape(json.dumps({
+            "storageKey": f"vl_expander_open:{self.expander_id}",
+            "serverOpen": bool(self.expanded),
+        }, ensure_ascii=False, separators=(",", ":")), quote=True)
+        open_attr = "open" if self.expanded else ""
+        details_open = f'<wa-details id="{details_cid}" data-vl-init="expander-persistence" data-vl-expander-config="{expander_config}" {open_attr}>'
+
+        # Register builder BEFORE entering context
+        def builder():
+            store = get_session_store()
+
+            # Render child components (static first, then dynamic)
+            htmls = _render_fragment_children(self._static_children, store['fragment_components'], self.expander_id)
+
+            inner_html = "".join(htmls)
+            summary_html = summary_builder().render()
+            html = f'''
+            {details_open}
+                {summary_html}
+                <div style="padding:0.5rem 0; display:flex; flex-direction:column; width:100%; min-width:0;">{inner_html}</div>
+            </wa-details>
+            '''
+            _wd = self.app._get_widget_defaults("expander")
+            _fc = merge_cls(_wd.get("cls", ""), self.user_cls)
+            _fs = merge_style(_wd.get("style", ""), self.user_style)
+            return Component("div", id=self.expander_id, content=html, class_=_fc or None, style=_fs or None)
+
+        self.app._register_component(self.expander_id, builder)
+        _reset_dynamic_fragment_children(self.expander_id)
+
+        # Now set fragment context for children
+        self.token = fragment_ctx.set(self.expander_id)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        fragment_ctx.reset(self.token)
+
+    def __getattr__(self, name):
+        return _delegate_app_attr(self, self.app, name)
+
+
+class ListContainerContext:
+    """Context manager returned by ``list_container()``"""
+    def __init__(self, app, container_id, gap, style_props):
+        self.app = app
+        self.container_id = container_id
+        self.gap = gap
+        self.style_props = style_props
+
+    def __enter__(self):
+        # Use predefined class + optional customizations (fixed per container)
+        extra_styles = []
+        if self.gap:
+            extra_styles.append(f"gap: {self.gap}")
+        for k, v in self.style_props.items():
+            extra_styles.append(f"{k.replace('_', '-')}: {v}")
+        style_str = "; ".join(extra_styles) if extra_styles else None
+        self._static_children = _bind_static_fragment_children(self.app, self.container_id)
+
+        # Register builder
+        def builder():
+            store = get_session_store()
+
+            # Render child components (static first, then dynamic)
+            htmls = _render_fragment_children(self._static_children, store['fragment_components'], self.container_id)
+
+            inner_html = "".join(htmls)
+            if style_str:
+                return Component("div", id=self.container_id, content=inner_html, class_="violit-list-container", style=style_str)
+            else:
+                return Component("div", id=self.container_id, content=inner_html, class_="violit-list-container")
+
+        self.app._register_component(self.container_id, builder)
+        _reset_dynamic_fragment_children(self.container_id)
+
+        # Set fragment context
+        self.token = fragment_ctx.set(self.container_id)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        fragment_ctx.reset(self.token)
+
+    def __getattr__(self, name):
+        return _delegate_app_attr(self, self.app, name)
+
+
+class PopoverContext:
+    """Context manager returned by ``popover()``"""
+    def __init__(self, app, popover_id, label, use_container_width, disabled, help_text, user_cls, user_style):
+        self.app = app
+        self.popover_id = popover_id
+        self.label = label
+        self.use_container_width = use_container_width
+        self.disabled = disabled
+        self.help_text = help_text
+        self.user_cls = user_cls
+        self.user_style = user_style
+
+    def __enter__(self):
+        self._static_children = _bind_static_fragment_children(self.app, self.popover_id)
+        # Fixed per popover; the help text lands in an attribute, so escape it once here
+        disabled_attr = 'disabled' if self.disabled else ''
+        width_style = 'style="width:100%;"' if self.use_container_width else ''
+        help_attr = f'title="{html_lib.escape(str(self.help_text), quote=True)}"' if self.help_text else ''
+
+        def builder():
+            store = get_session_store()
+
+            htmls = _render_fragment_children(self._static_children, store['fragment_components'], self.popover_id)
+
+            inner_html = "".join(htmls)
+
+            html = f'''
+            <wa-dropdown id="{self.popover_id}" {disabled_attr}>
+                <wa-button slot="trigger" with-caret variant="neutral" appearance="outlined" {disabled_attr} {width_style} {help_attr}>
+                    {self.label}
+                </wa-button>
+                <div style="padding: 1rem; background: var(--wa-color-surface-raised, var(--vl-bg-card)); border-radius: var(--wa-border-radius-m, var(--vl-radius)); min-width: 200px; max-width: 400px; box-shadow: 0 18px 38px rgba(15, 23, 42, 0.18);">
+                    {inner_html}
+                </div>
+            </wa-dropdown>
+            '''
+            _wd = self.app._get_widget_defaults("popover")
+            _fc = merge_cls(_wd.get("cls", ""), self.user_cls)
+            _fs = merge_style(_wd.get("style", ""), self.user_style)
+            return Component("div", id=f"{self.popover_id}_wrap", content=html, class_=_fc or None, style=_fs or None)
+
+        self.app._register_component(self.popover_id, builder)
+        _reset_dynamic_fragment_children(self.popover_id)
+        self.token = fragment_ctx.set(self.popover_id)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        fragment_ctx.reset(self.token)
+
+    def __getattr__(self, name):
+        return _delegate_app_attr(self, self.app, name)
+
+
 class ColumnObject:
     """Represents a single column in a column layout"""
     def __init__(self, app, columns_id, col_index, total_cols, gap):
@@ -891,13 +909,11 @@ class ColumnObject:
         self.col_id = f"{columns_id}_col_{col_index}"
         
     def __enter__(self):
-        from ..context import fragment_ctx, rendering_ctx
         self.token = fragment_ctx.set(self.col_id)
         # We don't set rendering_ctx here because individual widgets inside will set their own
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        from ..context import fragment_ctx
         fragment_ctx.reset(self.token)
     
     def __getattr__(self, name):
@@ -909,14 +925,14 @@ class ColumnObject:
 
         @wraps(attr)
         def column_bound(*args, **kwargs):
-            from ..context import fragment_ctx
-
             token = fragment_ctx.set(self.col_id)
             try:
                 return attr(*args, **kwargs)
             finally:
                 fragment_ctx.reset(token)
 
+        # Build the wrapper once per method; later lookups hit the instance dict
+        self.__dict__[name] = column_bound
         return column_bound
 
 
@@ -936,5 +952,5 @@ class TabObject:
         fragment_ctx.reset(self.token)
     
     def __getattr__(self, name):
-        return getattr(self.app, name)
+        return _delegate_app_attr(self, self.app, name)
 
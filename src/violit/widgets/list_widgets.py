@@ -7,6 +7,9 @@ from ..state import State
 from ..style_utils import merge_cls, merge_style
 
 
+_ITEM_OPEN = '<div style="padding: 0.5rem;">'
+
+
 class ListWidgetsMixin:
     
     def reactive_list(self, 
@@ -29,33 +32,34 @@ class ListWidgetsMixin:
         else:
             list_state = self.state(items or [], key=state_key)
 
+        # The wrapper and empty-state markup are fixed per list
+        list_open = f'''
+            <div id="{container_id}" style="display: flex; flex-direction: column; gap: {item_gap}; width: 100%;">
+                '''
+        list_close = '''
+            </div>
+            '''
+        empty_html = (
+            f'<div style="text-align: center; padding: 2rem; color: var(--vl-text-muted);">{empty_message}</div>'
+            if empty_message else ''
+        )
+
         def builder():
             token = rendering_ctx.set(cid)
             current_items = list_state.value
             rendering_ctx.reset(token)
             
             if not current_items:
-                if empty_message:
-                    content = f'<div style="text-align: center; padding: 2rem; color: var(--vl-text-muted);">{empty_message}</div>'
-                else:
-                    content = ''
+                content = empty_html
             else:
-                items_to_render = list(reversed(current_items)) if reverse else current_items
+                items_to_render = reversed(current_items) if reverse else current_items
                 
                 if render_item:
-                    rendered_items = []
-                    for item in items_to_render:
-                        item_html = render_item(item)
-                        rendered_items.append(item_html)
-                    content = ''.join(rendered_items)
+                    content = ''.join([render_item(item) for item in items_to_render])
                 else:
-                    content = ''.join([f'<div style="padding: 0.5rem;">{item}</div>' for item in items_to_render])
+                    content = ''.join([f'{_ITEM_OPEN}{item}</div>' for item in items_to_render])
             
-            html = f'''
-            <div id="{container_id}" style="display: flex; flex-direction: column; gap: {item_gap}; width: 100%;">
-                {content}
-            </div>
-            '''
+            html = f'{list_open}{content}{list_close}'
             
             _wd = self._get_widget_defaults("reactive_list")
             _fc = merge_cls(_wd.get("cls", ""), cls)
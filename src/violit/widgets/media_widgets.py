@@ -34,14 +34,18 @@ def _media_public_url(app, path: str, media_type: str) -> str:
 
     resolved_path = os.path.abspath(path)
     store = get_session_store()
-    registry = store.setdefault("_vl_media_sources", {})
+    registry = store["_vl_media_sources"]
     media_id = uuid.uuid4().hex
     registry[media_id] = {
         "path": resolved_path,
         "media_type": media_type,
         "name": os.path.basename(resolved_path) or "media",
     }
-    url = app._public_path(f"/__violit_media/{media_id}")
+    return _view_scoped_url(app._public_path(f"/__violit_media/{media_id}"))
+
+
+def _view_scoped_url(url: str) -> str:
+    """Tag a session-scoped URL with the current view so its route finds the store."""
     current_view_id = str(view_ctx.get() or "").strip()
     if not current_view_id:
         return url
@@ -1,5 +1,6 @@
 """Status Widgets Mixin for Violit"""
 
+import itertools
 from typing import Any, Callable, Optional, Union
 from ..component import Component
 from ..context import rendering_ctx, session_ctx, view_ctx
@@ -58,7 +59,7 @@ class StatusWidgetsMixin:
             if sid and current_view_id and getattr(self, 'ws_engine', None) and self.ws_engine.has_socket(sid, current_view_id):
                 try:
                     asyncio.get_running_loop()
-                    store.setdefault('client_command_queue', []).append(command)
+                    store['client_command_queue'].append(command)
                 except RuntimeError:
                     _loop = asyncio.new_event_loop()
                     try:
@@ -68,17 +69,17 @@ class StatusWidgetsMixin:
                     finally:
                         _loop.close()
             else:
-                store.setdefault('client_command_queue', []).append(command)
+                store['client_command_queue'].append(command)
         else:
             if command['name'] == 'toast.show':
-                store.setdefault('toasts', []).append(dict(command['payload']))
+                store['toasts'].append(dict(command['payload']))
                 return
             if command['name'] == 'effect.play':
                 effect_name = command['payload'].get('effect')
                 if effect_name:
-                    store.setdefault('effects', []).append(str(effect_name))
+                    store['effects'].append(str(effect_name))
                 return
-            store.setdefault('client_command_queue', []).append(command)
+            store['client_command_queue'].append(command)
 
     def success(self, *args, icon: Optional[Union[str, bool]] = None, show_icon: bool = True, cls: str = "", style: str = "", key=None): 
         """Display success alert"""
@@ -453,14 +454,14 @@ class StatusWidgetsMixin:
                 def builder():
                     store = get_session_store()
                     
-                    # Collect nested content
-                    htmls = []
-                    # Check static
-                    for cid_child, b in self.app.static_fragment_components.get(self.status_id, []):
-                        htmls.append(b().render())
-                    # Check session
-                    for cid_child, b in store['fragment_components'].get(self.status_id, []):
-                        htmls.append(b().render())
+                    # Collect nested content (static first, then session)
+                    htmls = [
+                        b().render()
+                        for _, b in itertools.chain(
+                            self.app.static_fragment_components.get(self.status_id, ()),
+                            store['fragment_components'].get(self.status_id, ()),
+                        )
+                    ]
                     
                     inner_html = "".join(htmls)
                     